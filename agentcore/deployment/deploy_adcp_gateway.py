@@ -33,15 +33,37 @@ import subprocess
 import sys
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, UnknownServiceError
 from io import BytesIO
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Client configuration for the bedrock-agentcore-control API
+AGENTCORE_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=5,
+    read_timeout=60,
+)
+
 
 class AdCPGatewayDeployer:
     """Deploy AdCP MCP Gateway with Lambda targets"""
     
+    # Backoff schedule (seconds) used while a freshly created IAM role propagates
+    ROLE_PROPAGATION_DELAYS = (0.5, 1, 2, 4, 8, 15)
+    
+    # Backoff schedule (seconds) used while polling a gateway target for READY
+    TARGET_READY_DELAYS = (0.5, 1, 2, 4, 8, 16)
+    TARGET_FAILED_STATUSES = ("FAILED", "UPDATE_UNSUCCESSFUL", "SYNCHRONIZE_UNSUCCESSFUL")
+    
     @staticmethod
     def _validate_aws_identifier(value: str, name: str) -> str:
         """Validate AWS identifiers to prevent command injection"""
@@ -61,6 +83,30 @@ class AdCPGatewayDeployer:
             raise ValueError(f"Invalid AWS profile name: {profile}")
         return profile
     
+    @staticmethod
+    def _is_role_propagation_error(message: str) -> bool:
+        """Check whether an error message indicates an IAM role that is not yet assumable"""
+        message = message.lower()
+        return "cannot be assumed" in message or "unable to assume" in message
+    
+    def _call_with_role_retry(self, fn, *args, **kwargs):
+        """
+        Call an AWS API that consumes a freshly created IAM role.
+        
+        IAM is eventually consistent, so instead of sleeping for a fixed period after
+        creating a role, retry the consuming call with exponential backoff until the
+        role can be assumed. Existing roles succeed on the first attempt.
+        """
+        for delay in self.ROLE_PROPAGATION_DELAYS:
+            try:
+                return fn(*args, **kwargs)
+            except ClientError as e:
+                if not self._is_role_propagation_error(str(e)):
+                    raise
+                logger.info(f"IAM role not assumable yet, retrying in {delay}s...")
+                time.sleep(delay)  # nosemgrep: arbitrary-sleep - Backoff while IAM role propagates
+        return fn(*args, **kwargs)
+    
     def __init__(self, stack_prefix: str, unique_id: str, region: str = "us-east-1", profile: str = None):
         self.stack_prefix = stack_prefix
         self.unique_id = unique_id
@@ -96,12 +142,22 @@ class AdCPGatewayDeployer:
                 logger.error("No profile was specified. Pass --profile <profile_name> or set AWS_PROFILE environment variable.")
             raise
         
+        try:
+            self.agentcore_client = session.client("bedrock-agentcore-control", config=AGENTCORE_CLIENT_CONFIG)
+        except UnknownServiceError:
+            raise RuntimeError(
+                "bedrock-agentcore-control is not available in this boto3 version. "
+                "Upgrade with: pip install --upgrade boto3 botocore"
+            ) from None
+        
         self.gateway_name = f"{stack_prefix}-ads-gw-{unique_id}"
         self.lambda_name = f"{stack_prefix}-adcp-handler-{unique_id}"
         self.role_name = f"{stack_prefix}-adcp-lambda-role-{unique_id}"
         self.gateway_role_name = f"{stack_prefix}-ads-gw-role-{unique_id}"
         self.invoke_role_name = f"{stack_prefix}-adcp-invoke-role-{unique_id}"
         self._session = session
+        # Gateway target listings per gateway ID, reused for the lifetime of this deployer
+        self._targets_cache = {}
         
     def create_lambda_execution_role(self) -> str:
         """Create IAM role for AdCP Lambda functions"""
@@ -154,10 +210,7 @@ class AdCPGatewayDeployer:
             )
             logger.info(f"Attached SSM parameter access policy to role: {self.role_name}")
             
-            # Wait for role propagation
-            logger.info("Waiting for IAM role propagation (10 seconds)...")
-            time.sleep(10)  # nosemgrep: arbitrary-sleep - Intentional delay for IAM role propagation
-            
+            # Role propagation is handled by retrying the consuming call (see _call_with_role_retry)
             return role_arn
             
         except self.iam_client.exceptions.EntityAlreadyExistsException:
@@ -185,22 +238,23 @@ class AdCPGatewayDeployer:
         1. Be assumed by the bedrock-agentcore service
         2. Invoke the Lambda function (outbound auth)
         """
+        role_arn = self._create_bare_gateway_role()
+        self._attach_lambda_invoke_policy(lambda_arn)
+        return role_arn
+    
+    def _create_bare_gateway_role(self) -> str:
+        """
+        Create (or reuse) the gateway IAM role without any Lambda permissions.
+        
+        Split from create_gateway_role so the role can be created while the
+        Lambda function is still deploying.
+        """
         # Try multiple service principals - the correct one depends on the region/account
         service_principals = [
             "bedrock-agentcore.amazonaws.com",
             "gateway.bedrock-agentcore.amazonaws.com", 
         ]
         
-        # Policy to allow gateway to invoke Lambda
-        lambda_invoke_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Action": "lambda:InvokeFunction",
-                "Resource": lambda_arn
-            }]
-        }
-        
         role_arn = None
         last_error = None
         
@@ -240,18 +294,25 @@ class AdCPGatewayDeployer:
         if role_arn is None:
             raise Exception(f"Could not create gateway role with any service principal: {last_error}")
         
-        # Attach inline policy for Lambda invocation
+        # Role propagation is handled by retrying the consuming call (see _call_with_role_retry)
+        return role_arn
+    
+    def _attach_lambda_invoke_policy(self, lambda_arn: str):
+        """Allow the gateway role to invoke the AdCP Lambda function"""
+        lambda_invoke_policy = {
+            "Version": "2012-10-17",
+            "Statement": [{
+                "Effect": "Allow",
+                "Action": "lambda:InvokeFunction",
+                "Resource": lambda_arn
+            }]
+        }
+        
         self.iam_client.put_role_policy(
             RoleName=self.gateway_role_name,
             PolicyName="LambdaInvokePolicy",
             PolicyDocument=json.dumps(lambda_invoke_policy)
         )
-        
-        # Wait for role propagation
-        logger.info("Waiting for gateway role propagation (10 seconds)...")
-        time.sleep(10)  # nosemgrep: arbitrary-sleep - Intentional delay for IAM role propagation
-        
-        return role_arn
     
     def create_gateway_invoke_role(self, gateway_id: str, caller_arn: str = None) -> str:
         """
@@ -453,7 +514,8 @@ class AdCPGatewayDeployer:
         code_zip = self.create_adcp_lambda_code()
         
         try:
-            response = self.lambda_client.create_function(
+            response = self._call_with_role_retry(
+                self.lambda_client.create_function,
                 FunctionName=self.lambda_name,
                 Runtime="python3.11",
                 Role=role_arn,
@@ -489,76 +551,44 @@ class AdCPGatewayDeployer:
             return response["Configuration"]["FunctionArn"]
     
     def get_existing_gateway(self) -> dict:
-        """Check if gateway already exists and return its info using AWS CLI"""
+        """Check if gateway already exists and return its info"""
         logger.info(f"Checking for existing gateway: {self.gateway_name}")
         
-        # Validate region to prevent command injection
-        validated_region = self._validate_aws_identifier(self.region, "region")
-        
-        # Set up environment with AWS_PROFILE if specified
-        env = os.environ.copy()
-        if self.profile:
-            validated_profile = self._validate_aws_profile(self.profile)
-            env["AWS_PROFILE"] = validated_profile
-        
         try:
-            # Use AWS CLI to list gateways (more reliable than agentcore CLI)
-            cmd = [
-                "aws", "bedrock-agentcore-control", "list-gateways",
-                "--region", validated_region
-            ]
-            
-            # nosemgrep: dangerous-subprocess-use-audit
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=env)
-            
-            if result.returncode == 0:
-                gateways_data = json.loads(result.stdout)
-                # Find gateway by name
-                for gw in gateways_data.get("items", []):
-                    if gw.get("name") == self.gateway_name:
-                        gateway_id = gw.get("gatewayId")
-                        # Validate gateway_id from API response before using in subprocess
-                        validated_gateway_id = self._validate_aws_identifier(gateway_id, "gateway_id")
-                        logger.info(f"Found existing gateway: {self.gateway_name} (ID: {validated_gateway_id})")
-                        
-                        # Get full gateway details
-                        get_cmd = [
-                            "aws", "bedrock-agentcore-control", "get-gateway",
-                            "--gateway-identifier", validated_gateway_id,
-                            "--region", validated_region
-                        ]
-                        
-                        get_result = subprocess.run(get_cmd, capture_output=True, text=True, timeout=60, env=env)  # nosemgrep: dangerous-subprocess-use-audit, dangerous-subprocess-use-tainted-env-args
-                        
-                        if get_result.returncode == 0:
-                            gw_details = json.loads(get_result.stdout)
-                            return {
-                                "status": "exists",
-                                "gateway_id": gw_details.get("gatewayId"),
-                                "gateway_arn": gw_details.get("gatewayArn"),
-                                "gateway_url": gw_details.get("gatewayUrl"),
-                                "role_arn": gw_details.get("roleArn"),
-                                "output": get_result.stdout
-                            }
-                        
-                        # Fallback: construct ARN and URL from gateway ID
+            # Find gateway by name
+            paginator = self.agentcore_client.get_paginator("list_gateways")
+            for page in paginator.paginate():
+                for gw in page.get("items", []):
+                    if gw.get("name") != self.gateway_name:
+                        continue
+                    
+                    gateway_id = gw.get("gatewayId")
+                    logger.info(f"Found existing gateway: {self.gateway_name} (ID: {gateway_id})")
+                    
+                    # Get full gateway details
+                    try:
+                        gw_details = self.agentcore_client.get_gateway(gatewayIdentifier=gateway_id)
                         return {
                             "status": "exists",
-                            "gateway_id": gateway_id,
-                            "gateway_arn": f"arn:aws:bedrock-agentcore:{self.region}:{self.account_id}:gateway/{gateway_id}",
-                            "gateway_url": f"https://{gateway_id}.gateway.bedrock-agentcore.{self.region}.amazonaws.com/mcp"
+                            "gateway_id": gw_details.get("gatewayId"),
+                            "gateway_arn": gw_details.get("gatewayArn"),
+                            "gateway_url": gw_details.get("gatewayUrl"),
+                            "role_arn": gw_details.get("roleArn"),
                         }
+                    except (ClientError, BotoCoreError) as e:
+                        logger.warning(f"Failed to get gateway details: {e}")
+                    
+                    # Fallback: construct ARN and URL from gateway ID
+                    return {
+                        "status": "exists",
+                        "gateway_id": gateway_id,
+                        "gateway_arn": f"arn:aws:bedrock-agentcore:{self.region}:{self.account_id}:gateway/{gateway_id}",
+                        "gateway_url": f"https://{gateway_id}.gateway.bedrock-agentcore.{self.region}.amazonaws.com/mcp"
+                    }
             
             return {"status": "not_found"}
             
-        except subprocess.TimeoutExpired:
-            return {"status": "check_timeout"}
-        except FileNotFoundError:
-            return {"status": "cli_not_found", "message": "AWS CLI not found"}
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse gateway list response: {e}")
-            return {"status": "parse_error", "message": str(e)}
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             logger.warning(f"Error checking for existing gateway: {e}")
             return {"status": "check_error", "message": str(e)}
     
@@ -587,9 +617,6 @@ class AdCPGatewayDeployer:
             }
         
         try:
-            # Create bedrock-agentcore-control client
-            gateway_client = self._session.client('bedrock-agentcore-control', region_name=self.region)
-            
             # Build create_gateway parameters
             create_params = {
                 'name': self.gateway_name,
@@ -603,7 +630,7 @@ class AdCPGatewayDeployer:
                 create_params['roleArn'] = gateway_role_arn
             
             logger.info(f"Creating gateway with authorizerType=AWS_IAM")
-            response = gateway_client.create_gateway(**create_params)
+            response = self._call_with_role_retry(self.agentcore_client.create_gateway, **create_params)
             
             gateway_info = {
                 "gateway_id": response.get("gatewayId"),
@@ -622,7 +649,7 @@ class AdCPGatewayDeployer:
             
             return {"status": "success", **gateway_info}
             
-        except gateway_client.exceptions.ConflictException:
+        except self.agentcore_client.exceptions.ConflictException:
             logger.info(f"Gateway already exists (ConflictException): {self.gateway_name}")
             existing = self.get_existing_gateway()
             if existing.get("status") == "exists":
@@ -637,8 +664,8 @@ class AdCPGatewayDeployer:
             error_msg = str(e)
             logger.error(f"Gateway creation failed: {error_msg}")
             
-            # Fall back to CLI if boto3 fails (e.g., API not available)
-            if "UnknownServiceError" in error_msg or "Could not connect" in error_msg:
+            # Fall back to CLI if the API endpoint cannot be reached
+            if "Could not connect" in error_msg:
                 logger.info("Falling back to agentcore CLI for gateway creation...")
                 return self._create_gateway_via_cli(enable_semantic_search)
             
@@ -664,28 +691,30 @@ class AdCPGatewayDeployer:
             env["AWS_PROFILE"] = validated_profile
         
         try:
+            # Capture raw bytes and decode only the stream each branch actually uses
             # nosemgrep: dangerous-subprocess-use-audit
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, env=env)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=300, env=env)
             
             if result.returncode != 0:
-                if "ConflictException" in result.stderr or "already exists" in result.stderr.lower():
+                stderr = result.stderr.decode("utf-8", errors="replace")
+                if "ConflictException" in stderr or "already exists" in stderr.lower():
                     existing = self.get_existing_gateway()
                     if existing.get("status") == "exists":
                         return {"status": "success", "already_existed": True, **{k: v for k, v in existing.items() if k != "status"}}
                     return {"status": "success", "already_existed": True}
                 
-                logger.error(f"Gateway creation failed: {result.stderr}")
-                return {"status": "error", "message": result.stderr}
+                logger.error(f"Gateway creation failed: {stderr}")
+                return {"status": "error", "message": stderr}
             
             logger.info("Gateway created successfully via CLI")
+            stdout = result.stdout.decode("utf-8", errors="replace")
             
             # Parse output
             gateway_info = {}
-            import re
-            arn_match = re.search(r"'gatewayArn':\s*'([^']+)'", result.stdout)
-            url_match = re.search(r"'gatewayUrl':\s*'([^']+)'", result.stdout)
-            id_match = re.search(r"'gatewayId':\s*'([^']+)'", result.stdout)
-            role_match = re.search(r"'roleArn':\s*'([^']+)'", result.stdout)
+            arn_match = re.search(r"'gatewayArn':\s*'([^']+)'", stdout)
+            url_match = re.search(r"'gatewayUrl':\s*'([^']+)'", stdout)
+            id_match = re.search(r"'gatewayId':\s*'([^']+)'", stdout)
+            role_match = re.search(r"'roleArn':\s*'([^']+)'", stdout)
             
             if arn_match:
                 gateway_info["gateway_arn"] = arn_match.group(1)
@@ -701,7 +730,7 @@ class AdCPGatewayDeployer:
                 if fetched.get("status") == "exists":
                     gateway_info.update({k: v for k, v in fetched.items() if k != "status" and k != "output"})
             
-            return {"status": "success", "output": result.stdout, **gateway_info}
+            return {"status": "success", "output": stdout, **gateway_info}
             
         except subprocess.TimeoutExpired:
             return {"status": "timeout", "message": "Gateway creation timed out"}
@@ -710,31 +739,15 @@ class AdCPGatewayDeployer:
     
     def get_gateway_targets(self, gateway_id: str) -> list:
         """Get existing targets for a gateway"""
-        # Validate inputs to prevent command injection
-        validated_gateway_id = self._validate_aws_identifier(gateway_id, "gateway_id")
-        validated_region = self._validate_aws_identifier(self.region, "region")
-        
-        env = os.environ.copy()
-        if self.profile:
-            validated_profile = self._validate_aws_profile(self.profile)
-            env["AWS_PROFILE"] = validated_profile
-        
+        targets = []
         try:
-            cmd = [
-                "aws", "bedrock-agentcore-control", "list-gateway-targets",
-                "--gateway-identifier", validated_gateway_id,
-                "--region", validated_region
-            ]
-            # nosemgrep: dangerous-subprocess-use-audit
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=env)
-            
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                return data.get("items", [])
-        except Exception as e:
+            paginator = self.agentcore_client.get_paginator("list_gateway_targets")
+            for page in paginator.paginate(gatewayIdentifier=gateway_id):
+                targets.extend(page.get("items", []))
+        except (ClientError, BotoCoreError) as e:
             logger.warning(f"Failed to list gateway targets: {e}")
         
-        return []
+        return targets
     
     def get_adcp_tool_schema(self) -> list:
         """Return the AdCP tool schema for Lambda target"""
@@ -775,20 +788,22 @@ class AdCPGatewayDeployer:
         ]
     
     def add_lambda_target(self, gateway_arn: str, gateway_url: str, role_arn: str, lambda_arn: str, gateway_id: str = None) -> dict:
-        """Add Lambda target to MCP Gateway using AWS CLI (agentcore CLI has a bug with Lambda ARN)"""
+        """Add Lambda target to MCP Gateway (agentcore CLI has a bug with Lambda ARN)"""
         target_name = f"{self.gateway_name}-lambda-target"
         logger.info(f"Adding Lambda target to gateway: {target_name}")
         logger.info(f"Lambda ARN: {lambda_arn}")
         
         # Check if target already exists
         if gateway_id:
-            existing_targets = self.get_gateway_targets(gateway_id)
+            existing_targets = self._targets_cache.get(gateway_id)
+            if existing_targets is None:
+                existing_targets = self.get_gateway_targets(gateway_id)
+                self._targets_cache[gateway_id] = existing_targets
             for target in existing_targets:
                 if target.get("name") == target_name:
                     logger.info(f"Target already exists: {target_name}")
                     return {"status": "success", "already_existed": True, "target": target}
         
-        # Use AWS CLI directly (agentcore CLI doesn't allow specifying Lambda ARN)
         tool_schema = self.get_adcp_tool_schema()
         target_config = {
             "mcp": {
@@ -803,58 +818,81 @@ class AdCPGatewayDeployer:
         
         credential_config = [{"credentialProviderType": "GATEWAY_IAM_ROLE"}]
         
-        # Validate inputs to prevent command injection
-        validated_gateway_id = self._validate_aws_identifier(gateway_id or self.gateway_name, "gateway_id")
-        validated_target_name = self._validate_aws_identifier(target_name, "target_name")
-        validated_region = self._validate_aws_identifier(self.region, "region")
+        try:
+            # Retry while the gateway role propagates instead of sleeping up front
+            response = self._call_with_role_retry(
+                self.agentcore_client.create_gateway_target,
+                gatewayIdentifier=gateway_id or self.gateway_name,
+                name=target_name,
+                description="AdCP Lambda target for advertising protocol tools",
+                targetConfiguration=target_config,
+                credentialProviderConfigurations=credential_config
+            )
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            # Check if target already exists
+            if error_code == "ConflictException":
+                logger.info(f"Target already exists: {target_name}")
+                return {"status": "success", "already_existed": True}
+            # Check for permission issues - warn but don't fail deployment
+            if error_code == "AccessDeniedException":
+                logger.warning(f"Permission denied for CreateGatewayTarget. Your IAM role may need bedrock-agentcore:CreateGatewayTarget permission.")
+                logger.warning("The gateway was created but the Lambda target could not be added.")
+                logger.warning("You can add the target manually or update your IAM permissions and re-run.")
+                return {"status": "permission_denied", "message": str(e)}
+            logger.error(f"Target creation failed: {e}")
+            return {"status": "error", "message": str(e)}
+        except BotoCoreError as e:
+            logger.error(f"Target creation failed: {e}")
+            return {"status": "error", "message": str(e)}
         
-        cmd = [
-            "aws", "bedrock-agentcore-control", "create-gateway-target",
-            "--gateway-identifier", validated_gateway_id,
-            "--name", validated_target_name,
-            "--description", "AdCP Lambda target for advertising protocol tools",
-            "--target-configuration", json.dumps(target_config),
-            "--credential-provider-configurations", json.dumps(credential_config),
-            "--region", validated_region
-        ]
+        logger.info("Lambda target added successfully")
         
-        # Set up environment with AWS_PROFILE if specified
-        env = os.environ.copy()
-        if self.profile:
-            validated_profile = self._validate_aws_profile(self.profile)
-            env["AWS_PROFILE"] = validated_profile
+        target_id = response.get("targetId")
+        target = self._wait_target_ready(gateway_id or self.gateway_name, target_id)
+        target_status = target.get("status", response.get("status"))
         
-        try:
-            # nosemgrep: dangerous-subprocess-use-audit
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, env=env)
-            
-            if result.returncode != 0:
-                # Check if target already exists
-                if "ConflictException" in result.stderr or "already exists" in result.stderr.lower():
-                    logger.info(f"Target already exists: {target_name}")
-                    return {"status": "success", "already_existed": True}
-                # Check for permission issues - warn but don't fail deployment
-                if "AccessDeniedException" in result.stderr:
-                    logger.warning(f"Permission denied for CreateGatewayTarget. Your IAM role may need bedrock-agentcore:CreateGatewayTarget permission.")
-                    logger.warning("The gateway was created but the Lambda target could not be added.")
-                    logger.warning("You can add the target manually or update your IAM permissions and re-run.")
-                    return {"status": "permission_denied", "message": result.stderr}
-                logger.error(f"Target creation failed: {result.stderr}")
-                return {"status": "error", "message": result.stderr}
-            
-            logger.info("Lambda target added successfully")
-            
-            # Parse response to get target details
+        # Record the new target so later checks in this deploy skip the listing call
+        if gateway_id in self._targets_cache:
+            self._targets_cache[gateway_id].append(
+                {"targetId": target_id, "name": target_name, "status": target_status}
+            )
+        if target_status in self.TARGET_FAILED_STATUSES:
+            logger.error(f"Target {target_id} entered status {target_status}: {target.get('statusReasons')}")
+            return {"status": "error", "target_id": target_id, "target_status": target_status,
+                    "message": "; ".join(target.get("statusReasons", []))}
+        
+        return {"status": "success", "target_id": target_id, "target_status": target_status}
+    
+    def _wait_target_ready(self, gateway_id: str, target_id: str, timeout: float = 60) -> dict:
+        """
+        Poll a gateway target with exponential backoff until it is READY or failed.
+        
+        bedrock-agentcore-control has no waiter for gateway targets, so this polls
+        get_gateway_target instead of sleeping for a fixed period. Returns the last
+        target description (empty if it could not be fetched).
+        """
+        target = {}
+        deadline = time.monotonic() + timeout
+        for delay in self.TARGET_READY_DELAYS:
             try:
-                response_data = json.loads(result.stdout)
-                return {"status": "success", "output": result.stdout, "target_id": response_data.get("targetId")}
-            except json.JSONDecodeError:
-                return {"status": "success", "output": result.stdout}
+                target = self.agentcore_client.get_gateway_target(
+                    gatewayIdentifier=gateway_id, targetId=target_id
+                )
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(f"Could not get status for target {target_id}: {e}")
+                return target
             
-        except subprocess.TimeoutExpired:
-            return {"status": "timeout"}
-        except FileNotFoundError:
-            return {"status": "cli_not_found", "message": "AWS CLI not found"}
+            status = target.get("status")
+            if status == "READY" or status in self.TARGET_FAILED_STATUSES:
+                return target
+            if time.monotonic() + delay > deadline:
+                break
+            logger.info(f"Target {target_id} status {status}, checking again in {delay}s...")
+            time.sleep(delay)  # nosemgrep: arbitrary-sleep - Backoff while target becomes ready
+        
+        logger.warning(f"Target {target_id} not READY after {timeout}s (status: {target.get('status')})")
+        return target
     
     def deploy(self, enable_semantic_search: bool = False) -> dict:
         """Full deployment: Lambda + Gateway + Target"""
@@ -866,12 +904,18 @@ class AdCPGatewayDeployer:
             "lambda_name": self.lambda_name
         }
         
-        # Step 1: Deploy Lambda
+        # Steps 1 and 2 run concurrently: the gateway role only needs the Lambda ARN
+        # for its invoke policy, which is attached once both have finished
         logger.info("=" * 60)
         logger.info("Step 1: Deploying AdCP Lambda function")
+        logger.info("Step 2: Creating Gateway IAM Role (REQUIRED)")
         logger.info("=" * 60)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lambda_future = executor.submit(self.deploy_adcp_lambda)
+            role_future = executor.submit(self._create_bare_gateway_role)
+        
         try:
-            lambda_arn = self.deploy_adcp_lambda()
+            lambda_arn = lambda_future.result()
             results["lambda_arn"] = lambda_arn
             results["lambda_status"] = "success"
         except Exception as e:
@@ -880,12 +924,10 @@ class AdCPGatewayDeployer:
             results["lambda_error"] = str(e)
             return results
         
-        # Step 2: Create Gateway Role (REQUIRED for outbound auth to Lambda)
-        logger.info("=" * 60)
-        logger.info("Step 2: Creating Gateway IAM Role (REQUIRED)")
-        logger.info("=" * 60)
+        # Gateway Role is REQUIRED for outbound auth to Lambda
         try:
-            gateway_role_arn = self.create_gateway_role(lambda_arn)
+            gateway_role_arn = role_future.result()
+            self._attach_lambda_invoke_policy(lambda_arn)
             results["gateway_role_arn"] = gateway_role_arn
         except Exception as e:
             logger.error(f"FATAL: Could not create gateway role: {e}")
@@ -1017,6 +1059,18 @@ class AdCPGatewayDeployer:
         return results
 
 
+def _write_json(data: dict):
+    """Write a result dict to stdout as indented JSON without building an intermediate str"""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(data, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Deploy AdCP MCP Gateway for Agentic Advertising")
     parser.add_argument("--stack-prefix", required=True, help="Stack prefix for resource naming")
@@ -1051,17 +1105,17 @@ def main():
             "message": f"Failed to initialize deployer: {str(e)}",
             "hint": "Check AWS credentials and profile configuration"
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         return 1
     
     if args.lambda_only:
         # Just deploy Lambda
         try:
             lambda_arn = deployer.deploy_adcp_lambda()
-            print(json.dumps({"status": "success", "lambda_arn": lambda_arn}, indent=2))
+            _write_json({"status": "success", "lambda_arn": lambda_arn})
             return 0
         except Exception as e:
-            print(json.dumps({"status": "error", "message": str(e)}, indent=2))
+            _write_json({"status": "error", "message": str(e)})
             return 1
     
     if args.target_only:
@@ -1071,7 +1125,7 @@ def main():
             gateway_info = deployer.get_existing_gateway()
             
             if gateway_info.get("status") != "exists":
-                print(json.dumps({"status": "error", "message": "Gateway not found. Create gateway first."}, indent=2))
+                _write_json({"status": "error", "message": "Gateway not found. Create gateway first."})
                 return 1
             
             role_arn = gateway_info.get("role_arn")
@@ -1093,23 +1147,23 @@ def main():
                 "gateway_url": gateway_info.get("gateway_url"),
                 "target_result": target_result
             }
-            print(json.dumps(result, indent=2, default=str))
+            _write_json(result)
             return 0 if target_result.get("status") == "success" else 1
         except Exception as e:
-            print(json.dumps({"status": "error", "message": str(e)}, indent=2))
+            _write_json({"status": "error", "message": str(e)})
             return 1
     
     # Full deployment
     try:
         result = deployer.deploy(enable_semantic_search=args.enable_semantic_search)
-        print(json.dumps(result, indent=2, default=str))
+        _write_json(result)
         return 0 if result.get("status") in ["success", "partial"] else 1
     except Exception as e:
         error_result = {
             "status": "error",
             "message": f"Deployment failed: {str(e)}"
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         return 1
 
 
@@ -21,10 +21,11 @@ Registry Format:
 }
 """
 
+import copy
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 
 class RuntimeRegistry:
@@ -38,18 +39,83 @@ class RuntimeRegistry:
             self.project_root,
             f".agentcore-runtime-registry-{stack_prefix}-{unique_id}.json",
         )
+        # Parsed registry cached against the file's (mtime_ns, size) signature
+        self._cached_registry = None
+        self._cached_signature = None
 
-    def load_registry(self) -> Dict[str, Any]:
-        """Load the runtime registry from file"""
-        if os.path.exists(self.registry_file):
+    @staticmethod
+    def _file_signature(st: os.stat_result) -> Tuple[int, int]:
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_registry(self) -> Dict[str, Any]:
+        """
+        Return the parsed registry, re-reading the file only if it changed.
+
+        The returned dict is the cache itself: callers must not mutate it.
+        """
+        try:
+            st = os.stat(self.registry_file)
+        except FileNotFoundError:
+            return {"runtimes": {}}
+
+        signature = self._file_signature(st)
+        if self._cached_registry is None or signature != self._cached_signature:
             with open(self.registry_file, "r") as f:
-                return json.load(f)
-        return {"runtimes": {}}
+                self._cached_registry = json.load(f)
+            self._cached_signature = signature
+        return self._cached_registry
+
+    def load_registry(self) -> Dict[str, Any]:
+        """Load the runtime registry for modification (a copy the caller may mutate)"""
+        return copy.deepcopy(self._read_registry())
 
     def save_registry(self, registry: Dict[str, Any]):
-        """Save the runtime registry to file"""
-        with open(self.registry_file, "w") as f:
-            json.dump(registry, f, indent=2)
+        """Save the runtime registry to file atomically"""
+        tmp_file = f"{self.registry_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(registry, f, indent=2)
+                f.flush()
+                # Taken from our own file: after the replace, the path may
+                # already belong to another process's save
+                signature = self._file_signature(os.fstat(f.fileno()))
+            os.replace(tmp_file, self.registry_file)
+        except BaseException:
+            # Don't leave a partial temp file behind in the project root
+            try:
+                os.unlink(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self._cached_registry = copy.deepcopy(registry)
+        self._cached_signature = signature
+
+    @staticmethod
+    def _build_runtime_info(
+        agent_name: str,
+        pool_id: str = None,
+        client_id: str = None,
+        discovery_url: str = None,
+        protocol: str = None,
+    ) -> Dict[str, Any]:
+        runtime_info = {
+            "name": agent_name,
+            "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+        # Add A2A auth configuration if provided (credentials for on-demand token generation)
+        if pool_id and client_id:
+            runtime_info.update(
+                {
+                    "pool_id": pool_id or "",
+                    "client_id": client_id or "",
+                    "discovery_url": discovery_url or "",
+                    "protocol": protocol or "A2A",
+                }
+            )
+
+        return runtime_info
 
     def register_runtime(
         self,
@@ -76,31 +142,42 @@ class RuntimeRegistry:
         """
         registry = self.load_registry()
 
-        runtime_info = {
-            "name": agent_name,
-            "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
-
-        # Add A2A auth configuration if provided (credentials for on-demand token generation)
-        if pool_id and client_id:
-            runtime_info.update(
-                {
-                    "pool_id": pool_id or "",
-                    "client_id": client_id or "",
-                    "discovery_url": discovery_url or "",
-                    "protocol": protocol or "A2A",
-                }
-            )
+        runtime_info = self._build_runtime_info(
+            agent_name, pool_id, client_id, discovery_url, protocol
+        )
 
         registry["runtimes"][runtime_arn] = runtime_info
         self.save_registry(registry)
 
         return runtime_info
 
+    def batch_register(self, runtimes: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Register several runtimes with a single registry load and save.
+
+        Args:
+            runtimes: Tuples of (runtime_arn, agent_name, pool_id, client_id,
+                discovery_url, protocol); trailing auth fields may be omitted.
+
+        Returns:
+            The runtime info stored for each entry, in input order
+        """
+        registry = self.load_registry()
+
+        registered = []
+        for runtime_arn, agent_name, *auth in runtimes:
+            runtime_info = self._build_runtime_info(agent_name, *auth)
+            registry["runtimes"][runtime_arn] = runtime_info
+            registered.append(runtime_info)
+
+        self.save_registry(registry)
+        return registered
+
     def get_runtime_info(self, runtime_arn: str) -> Optional[Dict[str, Any]]:
         """Get runtime information by ARN"""
-        registry = self.load_registry()
-        return registry["runtimes"].get(runtime_arn)
+        runtime_info = self._read_registry()["runtimes"].get(runtime_arn)
+        # Entries hold only strings, so a shallow copy keeps the cache intact
+        return dict(runtime_info) if runtime_info is not None else None
 
     def get_auth_config(self, runtime_arn: str) -> Optional[Dict[str, str]]:
         """Get A2A authentication config (pool_id, client_id, discovery_url) for a runtime"""
@@ -115,8 +192,8 @@ class RuntimeRegistry:
 
     def get_all_runtimes(self) -> Dict[str, Dict[str, Any]]:
         """Get all registered runtimes"""
-        registry = self.load_registry()
-        return registry.get("runtimes", {})
+        runtimes = self._read_registry().get("runtimes", {})
+        return {arn: dict(info) for arn, info in runtimes.items()}
 
     def build_runtimes_env_value(self) -> str:
         """
@@ -126,17 +203,17 @@ class RuntimeRegistry:
         Bearer tokens are no longer included — agents authenticate on demand
         using Cognito credentials from A2A_POOL_ID/A2A_CLIENT_ID env vars.
         """
-        registry = self.load_registry()
-        runtimes = registry.get("runtimes", {})
+        runtimes = self._read_registry().get("runtimes", {})
 
         return ",".join(runtimes.keys())
 
     def remove_runtime(self, runtime_arn: str):
         """Remove a runtime from the registry"""
+        if runtime_arn not in self._read_registry()["runtimes"]:
+            return
         registry = self.load_registry()
-        if runtime_arn in registry["runtimes"]:
-            del registry["runtimes"][runtime_arn]
-            self.save_registry(registry)
+        del registry["runtimes"][runtime_arn]
+        self.save_registry(registry)
 
 
 def main():
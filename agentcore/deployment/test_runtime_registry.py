@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for runtime_registry.py
+
+Covers the registry's mtime-keyed cache, batch_register and the atomic save,
+for both copies of the module (agentcore/deployment and agentcore/deployment/agent).
+
+Usage:
+    python test_runtime_registry.py
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODULE_PATHS = [
+    os.path.join(HERE, "runtime_registry.py"),
+    os.path.join(HERE, "agent", "runtime_registry.py"),
+]
+
+ARN_1 = "arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/agent-1"
+ARN_2 = "arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/agent-2"
+
+
+def load_module(path):
+    """Import one copy of runtime_registry.py by file path"""
+    spec = importlib.util.spec_from_file_location("runtime_registry_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def for_each_module(test):
+    """Run a test against every copy of the module, each in a fresh project root"""
+    def run():
+        for path in MODULE_PATHS:
+            module = load_module(path)
+            project_root = tempfile.mkdtemp()
+            try:
+                test(module, project_root)
+            finally:
+                shutil.rmtree(project_root)
+    run.__name__ = test.__name__
+    run.__doc__ = test.__doc__
+    return run
+
+
+@for_each_module
+def test_load_save_reload(module, project_root):
+    """Saved runtimes are visible to this instance and to a fresh one"""
+    registry = module.RuntimeRegistry("stack", "abc123", project_root)
+    assert registry.get_all_runtimes() == {}
+
+    registry.register_runtime(ARN_1, "agent-1", "pool", "client", "https://issuer", None)
+    registry.batch_register([(ARN_2, "agent-2")])
+
+    for reader in (registry, module.RuntimeRegistry("stack", "abc123", project_root)):
+        assert set(reader.get_all_runtimes()) == {ARN_1, ARN_2}
+        assert reader.get_auth_config(ARN_1) == {
+            "pool_id": "pool", "client_id": "client", "discovery_url": "https://issuer",
+        }
+        assert reader.get_auth_config(ARN_2) is None
+        assert reader.build_runtimes_env_value() == f"{ARN_1},{ARN_2}"
+
+    # Getters hand out copies, so mutating a result leaves the cache intact
+    registry.get_runtime_info(ARN_1)["name"] = "changed"
+    registry.load_registry()["runtimes"].clear()
+    assert registry.get_runtime_info(ARN_1)["name"] == "agent-1"
+
+    registry.remove_runtime(ARN_1)
+    assert list(module.RuntimeRegistry("stack", "abc123", project_root).get_all_runtimes()) == [ARN_2]
+    assert not [name for name in os.listdir(project_root) if name.endswith(".tmp")]
+
+
+@for_each_module
+def test_external_modification_is_picked_up(module, project_root):
+    """A registry file rewritten by another process replaces the cached copy"""
+    registry = module.RuntimeRegistry("stack", "abc123", project_root)
+    registry.register_runtime(ARN_1, "agent-1")
+    assert registry.get_runtime_info(ARN_1)["name"] == "agent-1"
+
+    other = module.RuntimeRegistry("stack", "abc123", project_root)
+    other.register_runtime(ARN_2, "agent-2")
+    assert set(registry.get_all_runtimes()) == {ARN_1, ARN_2}
+
+    # A hand edit that keeps the size: the mtime alone must invalidate the cache
+    with open(registry.registry_file) as f:
+        text = f.read()
+    with open(registry.registry_file, "w") as f:
+        f.write(text.replace('"agent-1"', '"agent-9"'))
+    st = os.stat(registry.registry_file)
+    os.utime(registry.registry_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert registry.get_runtime_info(ARN_1)["name"] == "agent-9"
+
+
+@for_each_module
+def test_failed_save_keeps_file_and_removes_temp(module, project_root):
+    """A save that fails part-way leaves the previous registry and no temp file"""
+    registry = module.RuntimeRegistry("stack", "abc123", project_root)
+    registry.register_runtime(ARN_1, "agent-1")
+
+    try:
+        registry.save_registry({"runtimes": {ARN_2: {"name": object()}}})
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("saving an unserializable registry should fail")
+
+    with open(registry.registry_file) as f:
+        assert list(json.load(f)["runtimes"]) == [ARN_1]
+    assert list(registry.get_all_runtimes()) == [ARN_1]
+    assert not [name for name in os.listdir(project_root) if name.endswith(".tmp")]
+
+
+if __name__ == "__main__":
+    test_load_save_reload()
+    test_external_modification_is_picked_up()
+    test_failed_save_keeps_file_and_removes_temp()
+    print("✅ All tests passed")
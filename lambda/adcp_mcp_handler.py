@@ -13,14 +13,29 @@ Deployed via: agentcore/deployment/deploy_adcp_gateway.py
 """
 
 import csv
+import functools
+import itertools
 import json
 import logging
 import os
+import re
+import threading
+from collections import OrderedDict
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+_log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+# getLevelName maps known level names to ints; anything else falls back to INFO
+logger.setLevel(_log_level if isinstance(logging.getLevelName(_log_level), int) else logging.INFO)
+
+# orjson is used for response serialization when it is available (e.g. via a
+# Lambda layer); otherwise fall back to the stdlib json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # Data Loading - Load from bundled CSV files
@@ -29,93 +44,320 @@ logger.setLevel(logging.INFO)
 # Get the directory where this Lambda is deployed
 LAMBDA_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Typed CSV columns; any column not listed here is kept as a string
+_FLOAT_COLUMNS = frozenset({
+    'cpm_usd', 'avg_cpm_usd', 'min_spend_usd', 'accuracy_score',
+    'revenue_share_pct', 'coverage_percentage',
+})
+_INT_COLUMNS = frozenset({
+    'estimated_daily_impressions', 'estimated_daily_reach',
+    'size_individuals', 'size_households',
+})
+_BOOL_COLUMNS = frozenset({'is_live_ttd', 'is_live_dv360', 'is_live_xandr'})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# Column name -> coercer, resolved once per file from the CSV header
+_COERCERS = {
+    **{column: float for column in _FLOAT_COLUMNS},
+    **{column: int for column in _INT_COLUMNS},
+    **{column: _parse_bool for column in _BOOL_COLUMNS},
+}
+
+
 def load_csv_data(filename: str) -> List[Dict[str, Any]]:
     """Load data from a CSV file bundled with the Lambda."""
-    filepath = os.path.join(LAMBDA_DIR, "data", filename)
-    
-    # Try alternate filename if primary not found
-    if not os.path.exists(filepath):
-        # Try without spaces/parentheses variations
-        alt_filename = filename.replace(" (1)", "").replace(" ", "_")
-        alt_filepath = os.path.join(LAMBDA_DIR, "data", alt_filename)
-        if os.path.exists(alt_filepath):
-            filepath = alt_filepath
-        else:
-            logger.warning(f"CSV file not found: {filepath} or {alt_filepath}, using empty list")
-            return []
+    # Try the primary name, then without spaces/parentheses variations. Opening
+    # directly avoids separate os.path.exists() lookups before each open().
+    candidates = [
+        os.path.join(LAMBDA_DIR, "data", filename),
+        os.path.join(LAMBDA_DIR, "data", filename.replace(" (1)", "").replace(" ", "_")),
+    ]
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            data = []
-            for row in reader:
-                # Convert numeric fields
-                processed_row = {}
-                for key, value in row.items():
-                    if value == '':
-                        processed_row[key] = None
-                    elif key in ['cpm_usd', 'avg_cpm_usd', 'min_spend_usd', 'accuracy_score', 
-                                 'revenue_share_pct', 'coverage_percentage']:
-                        try:
-                            processed_row[key] = float(value)
-                        except (ValueError, TypeError):
-                            processed_row[key] = value
-                    elif key in ['estimated_daily_impressions', 'estimated_daily_reach', 
-                                 'size_individuals', 'size_households']:
-                        try:
-                            processed_row[key] = int(value)
-                        except (ValueError, TypeError):
-                            processed_row[key] = value
-                    elif key in ['is_live_ttd', 'is_live_dv360', 'is_live_xandr']:
-                        processed_row[key] = value.lower() == 'true'
-                    else:
+        content = None
+        for filepath in candidates:
+            try:
+                with open(filepath, 'r', encoding='utf-8', newline='') as f:
+                    # Read the whole file in one call and parse from memory so the
+                    # file handle is released before the row conversion loop runs
+                    content = f.read()
+                break
+            except FileNotFoundError:
+                continue
+        
+        if content is None:
+            logger.warning(f"CSV file not found: {' or '.join(candidates)}, using empty list")
+            return []
+        
+        # Read raw value lists and build exactly one dict per row, rather than
+        # a DictReader row dict plus a second converted copy
+        reader = csv.reader(StringIO(content))
+        header = next(reader, [])
+        width = len(header)
+        coercers = [_COERCERS.get(key) for key in header]
+        data = []
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                values += [''] * (width - len(values))
+            # Convert numeric fields
+            processed_row = {}
+            for key, coerce, value in zip(header, coercers, values):
+                if value == '':
+                    processed_row[key] = None
+                elif coerce is None:
+                    processed_row[key] = value
+                else:
+                    try:
+                        processed_row[key] = coerce(value)
+                    except ValueError:
                         processed_row[key] = value
-                data.append(processed_row)
-            logger.info(f"Loaded {len(data)} records from {filename}")
-            return data
+            data.append(processed_row)
+        logger.info(f"Loaded {len(data)} records from {filename}")
+        return data
     except Exception as e:
         logger.error(f"Error loading {filename}: {e}")
         return []
 
 
-# Lazy-load data on first use
-_PRODUCTS = None
-_SIGNALS = None
-_CAMPAIGNS = None
-_MEDIA_BUYS = {}  # In-memory storage for created media buys
+# Data is loaded at module import so parsing happens during cold start (INIT)
+# rather than on the first billed invocation. Lambda keeps module globals
+# alive across warm invocations, so subsequent requests reuse the parsed rows.
+# Rows are held in tuples so a handler cannot grow or reorder the shared
+# dataset that every later request on this container reads.
+_PRODUCTS: Tuple[Dict, ...] = tuple(load_csv_data("products.csv"))
+_SIGNALS: Tuple[Dict, ...] = tuple(load_csv_data("signals.csv"))
+_CAMPAIGNS: Tuple[Dict, ...] = tuple(load_csv_data("campaigns.csv"))
+
+# Map CSV channel names to the official AdCP channel enum
+_CHANNEL_MAP = {"ctv": "ctv", "online_video": "video", "display": "display", "audio": "audio"}
+
+# Constant response fragments, built once and shared by every response that
+# references them. Handlers must not mutate these.
+_CREATIVES_AGENT_URL = "https://creatives.adcontextprotocol.org"
+_VIDEO_FORMAT_IDS = {
+    duration: {"agent_url": _CREATIVES_AGENT_URL, "id": "video_hosted", "duration_ms": duration}
+    for duration in (30000, 15000, 6000)
+}
+_DISPLAY_FORMAT_ID = {"agent_url": _CREATIVES_AGENT_URL, "id": "display_static", "width": 300, "height": 250}
+_DEFAULT_FORMAT_IDS = (_VIDEO_FORMAT_IDS[30000],)
+_MEASUREMENT_NOTES = "MRC-accredited viewability measurement"
+_TIER_1_MEASUREMENT = {"provider": "Nielsen DAR", "notes": _MEASUREMENT_NOTES}
+_DEFAULT_MEASUREMENT = {"provider": "Google Ad Manager", "notes": _MEASUREMENT_NOTES}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_format_ids(format_types_str: Optional[str]) -> Tuple[Dict, ...]:
+    """Build AdCP format_ids from a product's comma-separated format_types column."""
+    format_types = format_types_str.split(",") if format_types_str else ["video_30s", "video_15s"]
+    format_ids = []
+    for ft in format_types:
+        ft = ft.strip()
+        if "video" in ft.lower() or "30s" in ft or "15s" in ft:
+            duration = 30000 if "30" in ft else 15000 if "15" in ft else 6000 if "6" in ft else 30000
+            format_ids.append(_VIDEO_FORMAT_IDS[duration])
+        elif "display" in ft.lower() or "banner" in ft.lower():
+            format_ids.append(_DISPLAY_FORMAT_ID)
+    
+    if not format_ids:
+        return _DEFAULT_FORMAT_IDS
+    
+    return tuple(format_ids)
+
+
+def _prepare_product(p: Dict) -> None:
+    """Attach request-invariant derived fields (prefixed with "_") to a product row."""
+    # Filter columns used by get_products
+    channel = p.get("channel", "")
+    p["_channel"] = _CHANNEL_MAP.get(channel, channel)
+    p["_delivery_type"] = "guaranteed" if p.get("brand_safety_tier") == "tier_1" else "non_guaranteed"
+    
+    # Response fields that only depend on the row. These objects are shared by
+    # every response, so they must not be mutated by handlers.
+    p["_format_ids"] = _build_format_ids(p.get("format_types", ""))
+    p["_publisher_properties"] = ({
+        "publisher_domain": (p.get("publisher_name") or "").lower().replace(" ", "") + ".com",
+        "selection_type": "by_tag",
+        "property_tags": (p.get("channel", "video"), "premium")
+    },)
+    p["_delivery_measurement"] = _TIER_1_MEASUREMENT if p.get("brand_safety_tier") == "tier_1" else _DEFAULT_MEASUREMENT
+    p["_description"] = f"{p.get('product_name')} inventory from {p.get('publisher_name')}"
+    p["_default_pricing_option_id"] = f"cpm_{p.get('product_id', 'default')}"
+    p["_cpm"] = p.get("avg_cpm_usd") or p.get("cpm_usd") or 25.0
+    p["_min_spend"] = p.get("min_spend_usd", 0)
+    p["_estimated_exposures"] = p.get("estimated_daily_impressions") or 1000000
+    
+    # verify_brand_safety rating for URLs that match this product
+    tier = p.get("brand_safety_tier", "tier_2")
+    p["_brand_safety_rating"] = (96 if tier == "tier_1" else 85 if tier == "tier_2" else 70, tier)
+    
+    # Normalize the columns handlers subscript directly, so a CSV missing one
+    # of them behaves like the old .get() defaults
+    p.setdefault("product_id", None)
+    p.setdefault("product_name", None)
+    p.setdefault("publisher_name", None)
+    p.setdefault("channel", "")
+
+
+def _prepare_signal(s: Dict) -> None:
+    """Attach request-invariant derived fields (prefixed with "_") to a signal row."""
+    # Map signal_type to the AdCP catalog_type
+    signal_type = s.get("signal_type", "audience")
+    s["_catalog_type"] = "marketplace" if signal_type == "audience" else "custom" if signal_type == "contextual" else "owned"
+    
+    # Coverage percentage from size
+    size = s.get("size_individuals", 0) or 0
+    s["_coverage"] = (size / 335000000) * 100 if size > 0 else 5.0  # US population base
+    
+    # (individuals, households) for reach aggregation
+    s["_sizes"] = (size, s.get("size_households", 0) or 0)
+    
+    # Response fields that only depend on the row
+    s["_description"] = f"{s.get('signal_name')} - {s.get('data_provider', 'Unknown provider')}"
+    s["_coverage_percentage"] = round(s["_coverage"], 1)
+    
+    # Normalize the columns handlers subscript directly, so a CSV missing one
+    # of them behaves like the old .get() defaults
+    s.setdefault("signal_id", None)
+    s.setdefault("signal_name", None)
+    s.setdefault("data_provider", None)
+    s.setdefault("cpm_usd", 0)
+    s.setdefault("is_live_ttd", False)
+    s.setdefault("ttd_segment_id", "")
+
+
+for _product in _PRODUCTS:
+    _prepare_product(_product)
+for _signal in _SIGNALS:
+    _prepare_signal(_signal)
+
+# In-memory storage for created media buys. Bounded so warm containers do not
+# grow without limit; the oldest media buys are evicted first.
+_MEDIA_BUYS: "OrderedDict[str, Dict]" = OrderedDict()
+_MEDIA_BUYS_MAX = 10_000
+_MEDIA_BUYS_LOCK = threading.Lock()
+# buyer_ref -> media buy ids in creation order, kept in step with _MEDIA_BUYS
+_MEDIA_BUY_IDS_BY_BUYER_REF: Dict[str, List[str]] = {}
 
+# Per-container sequence numbers for verification and study ids
+_VER_COUNTER = itertools.count(1)
+_STUDY_COUNTER = itertools.count(1)
 
-def get_products() -> List[Dict]:
-    """Get products data, loading from CSV on first call."""
-    global _PRODUCTS
-    if _PRODUCTS is None:
-        _PRODUCTS = load_csv_data("products.csv")
+
+def _index_by(rows: Tuple[Dict, ...], key: str) -> Dict[str, Dict]:
+    """Index rows by a primary key column, keeping the first row for duplicate keys."""
+    index = {}
+    for row in rows:
+        index.setdefault(row.get(key), row)
+    return index
+
+
+# Primary-key indexes so handlers resolve ids with a dict probe instead of a list scan
+_PRODUCTS_BY_ID = _index_by(_PRODUCTS, "product_id")
+_SIGNALS_BY_ID = _index_by(_SIGNALS, "signal_id")
+_CAMPAIGNS_BY_ID = _index_by(_CAMPAIGNS, "campaign_id")
+
+# Lower-cased property_url -> product, used by verify_brand_safety URL matching
+_PRODUCTS_BY_URL = {(p.get("property_url") or "").lower(): p for p in _PRODUCTS}
+
+
+def _registered_domain(url: str) -> str:
+    """Reduce a URL or bare hostname to its last two host labels (e.g. "www.espn.com" -> "espn.com")."""
+    url = url.strip().lower()
+    if "//" not in url:
+        url = "//" + url
+    try:
+        host = urlparse(url).hostname or ""
+    except ValueError:
+        return ""
+    return ".".join(host.split(".")[-2:])
+
+
+def _index_product_urls(products_by_url: Dict[str, Dict]) -> Dict[str, List[Tuple[str, Dict]]]:
+    """Group the non-empty (property_url, product) pairs by registered domain, keeping product order."""
+    by_domain: Dict[str, List[Tuple[str, Dict]]] = {}
+    for url, product in products_by_url.items():
+        if url:
+            by_domain.setdefault(_registered_domain(url), []).append((url, product))
+    return by_domain
+
+
+# Registered domain -> (property_url, product) pairs, so most verify_brand_safety
+# lookups are a single dict probe
+_PRODUCT_URLS_BY_DOMAIN = _index_product_urls(_PRODUCTS_BY_URL)
+
+
+def _match_product_url(url_lower: str) -> Optional[Dict]:
+    """
+    Find the product for a lower-cased URL.
+    
+    Products on the URL's own registered domain take precedence: the first of
+    them whose property_url occurs in the URL is returned, even when another
+    product's property_url also appears in the URL (e.g. in its query string).
+    Only if none does is every property_url tried as a substring, in product order.
+    """
+    for product_url, product in _PRODUCT_URLS_BY_DOMAIN.get(_registered_domain(url_lower), ()):
+        if product_url in url_lower:
+            return product
+    
+    for product_url, product in _PRODUCTS_BY_URL.items():
+        if product_url and product_url in url_lower:
+            return product
+    return None
+
+
+def get_products() -> Tuple[Dict, ...]:
+    """Get products data loaded at cold start (shared across requests, do not mutate)."""
     return _PRODUCTS
 
 
-def get_signals() -> List[Dict]:
-    """Get signals data, loading from CSV on first call."""
-    global _SIGNALS
-    if _SIGNALS is None:
-        _SIGNALS = load_csv_data("signals.csv")
+def get_signals() -> Tuple[Dict, ...]:
+    """Get signals data loaded at cold start (shared across requests, do not mutate)."""
     return _SIGNALS
 
 
-def get_campaigns() -> List[Dict]:
-    """Get campaigns data, loading from CSV on first call."""
-    global _CAMPAIGNS
-    if _CAMPAIGNS is None:
-        _CAMPAIGNS = load_csv_data("campaigns.csv")
+def get_campaigns() -> Tuple[Dict, ...]:
+    """Get campaigns data loaded at cold start (shared across requests, do not mutate)."""
     return _CAMPAIGNS
 
 
+def _lookup(index: Dict[str, Dict], key: Any) -> Optional[Dict]:
+    """Probe an id index; unhashable ids from the request (lists, objects) match nothing."""
+    try:
+        return index.get(key)
+    except TypeError:
+        return None
+
+
+def get_product(product_id: str) -> Optional[Dict]:
+    """Look up a single product by product_id."""
+    return _lookup(_PRODUCTS_BY_ID, product_id)
+
+
+def get_signal(signal_id: str) -> Optional[Dict]:
+    """Look up a single signal by signal_id."""
+    return _lookup(_SIGNALS_BY_ID, signal_id)
+
+
+def get_campaign(campaign_id: str) -> Optional[Dict]:
+    """Look up a single campaign by campaign_id."""
+    return _lookup(_CAMPAIGNS_BY_ID, campaign_id)
+
+
 # ============================================================================
 # Lambda Handler
 # ============================================================================
 
 def handler(event, context):
     """Main Lambda handler for AdCP MCP tools."""
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Only serialize the full event when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
     
     # Extract tool name from context (AgentCore Gateway passes it here)
     # See: https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/gateway-add-target-lambda.html
@@ -165,23 +407,15 @@ def handler(event, context):
         # AgentCore Gateway: event IS the arguments directly
         arguments = event if event else {}
     
-    logger.info(f"Tool: {tool_name}, Arguments: {json.dumps(arguments)}")
+    logger.info("Tool: %s", tool_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Arguments: %s", json.dumps(arguments))
     
     # Route to appropriate handler
-    handlers = {
-        "get_products": handle_get_products,
-        "get_signals": handle_get_signals,
-        "activate_signal": handle_activate_signal,
-        "create_media_buy": handle_create_media_buy,
-        "get_media_buy_delivery": handle_get_media_buy_delivery,
-        "verify_brand_safety": handle_verify_brand_safety,
-        "resolve_audience_reach": handle_resolve_audience_reach,
-        "configure_brand_lift_study": handle_configure_study,
-    }
-    
-    if tool_name in handlers:
+    tool_handler = _HANDLERS.get(tool_name)
+    if tool_handler is not None:
         try:
-            result = handlers[tool_name](arguments)
+            result = tool_handler(arguments)
             return format_response(200, result)
         except Exception as e:
             logger.error(f"Error handling {tool_name}: {str(e)}")
@@ -192,13 +426,24 @@ def handler(event, context):
     return format_response(400, {"error": f"Unknown tool: {tool_name}"})
 
 
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, preferring orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects some values json accepts, e.g. integers beyond 64 bits
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
+
+
 def format_response(status_code: int, result: Dict) -> Dict:
     """Format response for MCP Gateway."""
-    body = json.dumps(result)
+    body = _dumps(result)
     return {
         "statusCode": status_code,
         "body": body,
-        "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
+        "content": [{"type": "text", "text": _dumps(result, indent=True)}]
     }
 
 
@@ -206,6 +451,55 @@ def format_response(status_code: int, result: Dict) -> Dict:
 # Tool Handlers
 # ============================================================================
 
+def _build_product_response(p: Dict, brief_relevance: Optional[str]) -> Dict:
+    """Build an official schema product from a prepared product row."""
+    product_result = {
+        "product_id": p["product_id"],
+        "name": p["product_name"],
+        "description": p["_description"],
+        "publisher_properties": p["_publisher_properties"],
+        "format_ids": p["_format_ids"],
+        "delivery_type": p["_delivery_type"],
+        "pricing_options": [{
+            "pricing_option_id": p["_default_pricing_option_id"],
+            "pricing_model": "cpm",
+            "rate": p["_cpm"],
+            "currency": "USD",
+            "min_spend": p["_min_spend"]
+        }],
+        "estimated_exposures": p["_estimated_exposures"],
+        "delivery_measurement": p["_delivery_measurement"]
+    }
+    
+    # Add brief_relevance if brief provided
+    if brief_relevance is not None:
+        product_result["brief_relevance"] = brief_relevance
+    
+    return product_result
+
+
+def _iter_products(channels: List[str], delivery_type: Optional[str], min_budget: Optional[float],
+                   brief_relevance: Optional[str]) -> Iterator[Dict]:
+    """Yield official schema products matching the get_products filters."""
+    # Bind the builder to a local; this loop runs once per catalog row
+    build = _build_product_response
+    
+    for p in get_products():
+        # Filter by channel (CSV channel or its official enum mapping)
+        if channels and p["_channel"] not in channels and p["channel"] not in channels:
+            continue
+        
+        # Filter by delivery type (inferred from brand safety tier at load time)
+        if delivery_type and p["_delivery_type"] != delivery_type:
+            continue
+        
+        # Filter by budget
+        if min_budget and p["_min_spend"] > min_budget:
+            continue
+        
+        yield build(p, brief_relevance)
+
+
 def handle_get_products(args: Dict) -> Dict:
     """AdCP Media Buy Protocol - get_products (Official Schema)
     
@@ -225,93 +519,35 @@ def handle_get_products(args: Dict) -> Dict:
     max_budget = budget_range.get("max")
     countries = filters.get("countries", [])
     
-    products = get_products()
-    results = []
+    # brief_relevance only depends on the request, so build it once
+    brief_relevance = f"Matches campaign requirements: {brief[:80]}..." if brief else None
     
-    for p in products:
-        # Filter by channel (map CSV channel to official channels)
-        if channels:
-            product_channel = p.get("channel", "")
-            # Map old channel names to official enum
-            channel_map = {"ctv": "ctv", "online_video": "video", "display": "display", "audio": "audio"}
-            mapped_channel = channel_map.get(product_channel, product_channel)
-            if mapped_channel not in channels and product_channel not in channels:
-                continue
-        
-        # Filter by delivery type
-        if delivery_type:
-            # Infer delivery type from product data
-            product_delivery = "guaranteed" if p.get("brand_safety_tier") == "tier_1" else "non_guaranteed"
-            if product_delivery != delivery_type:
-                continue
-        
-        # Filter by budget
-        product_min_spend = p.get("min_spend_usd", 0)
-        if min_budget and product_min_spend > min_budget:
-            continue
-        
-        # Build official schema product response
-        cpm = p.get("avg_cpm_usd") or p.get("cpm_usd") or 25.0
-        publisher_domain = p.get("publisher_name", "").lower().replace(" ", "") + ".com"
-        
-        # Build format_ids from format_types
-        format_types_str = p.get("format_types", "")
-        format_types = format_types_str.split(",") if format_types_str else ["video_30s", "video_15s"]
-        format_ids = []
-        for ft in format_types:
-            ft = ft.strip()
-            if "video" in ft.lower() or "30s" in ft or "15s" in ft:
-                duration = 30000 if "30" in ft else 15000 if "15" in ft else 6000 if "6" in ft else 30000
-                format_ids.append({
-                    "agent_url": "https://creatives.adcontextprotocol.org",
-                    "id": "video_hosted",
-                    "duration_ms": duration
-                })
-            elif "display" in ft.lower() or "banner" in ft.lower():
-                format_ids.append({
-                    "agent_url": "https://creatives.adcontextprotocol.org",
-                    "id": "display_static",
-                    "width": 300,
-                    "height": 250
-                })
-        
-        if not format_ids:
-            format_ids = [{"agent_url": "https://creatives.adcontextprotocol.org", "id": "video_hosted", "duration_ms": 30000}]
-        
-        # Build official schema product
-        product_result = {
-            "product_id": p.get("product_id"),
-            "name": p.get("product_name"),
-            "description": f"{p.get('product_name')} inventory from {p.get('publisher_name')}",
-            "publisher_properties": [{
-                "publisher_domain": publisher_domain,
-                "selection_type": "by_tag",
-                "property_tags": [p.get("channel", "video"), "premium"]
-            }],
-            "format_ids": format_ids,
-            "delivery_type": "guaranteed" if p.get("brand_safety_tier") == "tier_1" else "non_guaranteed",
-            "pricing_options": [{
-                "pricing_option_id": f"cpm_{p.get('product_id', 'default')}",
-                "pricing_model": "cpm",
-                "rate": cpm,
-                "currency": "USD",
-                "min_spend": product_min_spend
-            }],
-            "estimated_exposures": p.get("estimated_daily_impressions") or 1000000,
-            "delivery_measurement": {
-                "provider": "Nielsen DAR" if p.get("brand_safety_tier") == "tier_1" else "Google Ad Manager",
-                "notes": "MRC-accredited viewability measurement"
-            }
-        }
-        
-        # Add brief_relevance if brief provided
-        if brief:
-            product_result["brief_relevance"] = f"Matches campaign requirements: {brief[:80]}..."
-        
-        results.append(product_result)
+    # The Lambda response is a single JSON document, so the generator is
+    # materialized here at the transport boundary
+    products = list(_iter_products(channels, delivery_type, min_budget, brief_relevance))
     
     # Return official schema response
-    return {"products": results}
+    return {"products": products}
+
+
+@functools.lru_cache(maxsize=256)
+def _derive_platform_keys(platform: str) -> Tuple[str, str]:
+    """Derive the (is_live, segment_id) signal column names for a deployment platform."""
+    platform_key = platform.replace("-", "_").replace("the_trade_desk", "ttd")
+    return f"is_live_{platform_key}", f"{platform_key}_segment_id"
+
+
+# Column names for the platforms that have columns in signals.csv
+_PLATFORM_KEYS = {
+    platform: _derive_platform_keys(platform)
+    for platform in ("the-trade-desk", "ttd", "dv360", "xandr")
+}
+
+
+def _platform_keys(platform: str) -> Tuple[str, str]:
+    """Look up the signal column names for a platform, deriving them for unknown platforms."""
+    keys = _PLATFORM_KEYS.get(platform)
+    return keys if keys is not None else _derive_platform_keys(platform)
 
 
 def handle_get_signals(args: Dict) -> Dict:
@@ -343,41 +579,40 @@ def handle_get_signals(args: Dict) -> Dict:
     if not requested_platforms:
         requested_platforms = ["the-trade-desk"]
     
-    signals = get_signals()
-    results = []
-    
-    for s in signals:
-        # Filter by catalog type (map signal_type to catalog_type)
-        signal_type = s.get("signal_type", "audience")
-        catalog_type = "marketplace" if signal_type == "audience" else "custom" if signal_type == "contextual" else "owned"
-        if catalog_types and catalog_type not in catalog_types:
+    # First pass: apply the cheap filters and stop as soon as enough signals match
+    candidates = []
+    for s in get_signals():
+        # Filter by catalog type (mapped from signal_type at load time)
+        if catalog_types and s["_catalog_type"] not in catalog_types:
             continue
         
         # Filter by data provider
-        if data_providers and s.get("data_provider") not in data_providers:
+        if data_providers and s["data_provider"] not in data_providers:
             continue
         
         # Filter by max CPM
-        cpm = s.get("cpm_usd", 0)
-        if max_cpm and cpm > max_cpm:
+        if max_cpm and s["cpm_usd"] > max_cpm:
             continue
         
-        # Calculate coverage percentage from size
-        size = s.get("size_individuals", 0) or 0
-        coverage = (size / 335000000) * 100 if size > 0 else 5.0  # US population base
-        if coverage < min_coverage:
+        # Filter by coverage percentage (derived from size at load time)
+        if s["_coverage"] < min_coverage:
             continue
         
+        candidates.append(s)
+        if max_results and len(candidates) >= max_results:
+            break
+    
+    # Second pass: build responses only for the signals being returned
+    results = []
+    for s in candidates:
         # Build deployments array for requested platforms
         deployments = []
         for platform in requested_platforms:
             # Map platform names
-            platform_key = platform.replace("-", "_").replace("the_trade_desk", "ttd")
-            is_live_key = f"is_live_{platform_key}"
-            segment_id_key = f"{platform_key}_segment_id"
+            is_live_key, segment_id_key = _platform_keys(platform)
             
-            is_live = s.get(is_live_key, s.get("is_live_ttd", False))
-            segment_id = s.get(segment_id_key, s.get("ttd_segment_id", ""))
+            is_live = s[is_live_key] if is_live_key in s else s["is_live_ttd"]
+            segment_id = s[segment_id_key] if segment_id_key in s else s["ttd_segment_id"]
             
             deployment = {
                 "type": "platform",
@@ -393,21 +628,18 @@ def handle_get_signals(args: Dict) -> Dict:
         
         # Build official schema signal response
         results.append({
-            "signal_agent_segment_id": s.get("signal_id"),
-            "name": s.get("signal_name"),
-            "description": f"{s.get('signal_name')} - {s.get('data_provider', 'Unknown provider')}",
-            "signal_type": catalog_type,
-            "data_provider": s.get("data_provider"),
-            "coverage_percentage": round(coverage, 1),
+            "signal_agent_segment_id": s["signal_id"],
+            "name": s["signal_name"],
+            "description": s["_description"],
+            "signal_type": s["_catalog_type"],
+            "data_provider": s["data_provider"],
+            "coverage_percentage": s["_coverage_percentage"],
             "deployments": deployments,
             "pricing": {
-                "cpm": cpm,
+                "cpm": s["cpm_usd"],
                 "currency": "USD"
             }
         })
-        
-        if max_results and len(results) >= max_results:
-            break
     
     # Return official schema response
     return {"signals": results}
@@ -427,8 +659,7 @@ def handle_activate_signal(args: Dict) -> Dict:
         platform = args.get("decisioning_platform", "ttd")
         deployments_requested = [{"type": "platform", "platform": platform}]
     
-    signals = get_signals()
-    signal = next((s for s in signals if s.get("signal_id") == signal_id), None)
+    signal = get_signal(signal_id)
     
     if not signal:
         # Return error response per official schema
@@ -439,19 +670,25 @@ def handle_activate_signal(args: Dict) -> Dict:
             }]
         }
     
+    invalid = [dep for dep in deployments_requested if not isinstance(dep, dict)]
+    if invalid:
+        return {
+            "errors": [{
+                "code": "INVALID_DEPLOYMENT",
+                "message": f"Deployments must be objects, got: {invalid[0]!r}"
+            }]
+        }
+    
     # Build deployment results
     deployment_results = []
     for dep in deployments_requested:
         dep_type = dep.get("type", "platform")
         platform = dep.get("platform", "the-trade-desk")
         
-        # Map platform names
-        platform_key = platform.replace("-", "_").replace("the_trade_desk", "ttd")
-        is_live_key = f"is_live_{platform_key}"
-        segment_id_key = f"{platform_key}_segment_id"
-        
-        is_live = signal.get(is_live_key, signal.get("is_live_ttd", False))
-        segment_id = signal.get(segment_id_key, signal.get("ttd_segment_id", ""))
+        # Map platform names, falling back to the TTD columns for unknown platforms
+        is_live_key, segment_id_key = _platform_keys(platform)
+        is_live = signal[is_live_key] if is_live_key in signal else signal["is_live_ttd"]
+        segment_id = signal[segment_id_key] if segment_id_key in signal else signal["ttd_segment_id"]
         
         deployment_result = {
             "type": dep_type,
@@ -491,19 +728,15 @@ def handle_create_media_buy(args: Dict) -> Dict:
     
     media_buy_id = f"mb_{buyer_ref[:10].replace(' ', '_')}_{uuid.uuid4().hex[:6]}"
     created_packages = []
-    
-    products = get_products()
-    product_map = {p.get("product_id"): p for p in products}
+    package_id_prefix = "pkg_" + media_buy_id
     
     for i, pkg in enumerate(packages_input):
         budget = pkg.get("budget", 50000)
         product_id = pkg.get("product_id")
-        product = product_map.get(product_id, {})
-        cpm = product.get("avg_cpm_usd") or product.get("cpm_usd") or 40
         
         # Build official schema package response
         created_packages.append({
-            "package_id": f"pkg_{media_buy_id}_{i+1:03d}",
+            "package_id": "%s_%03d" % (package_id_prefix, i + 1),
             "buyer_ref": pkg.get("buyer_ref", f"{buyer_ref}_pkg_{i+1}"),
             "product_id": product_id,
             "budget": budget,
@@ -512,14 +745,24 @@ def handle_create_media_buy(args: Dict) -> Dict:
         })
     
     # Store media buy for later retrieval
-    _MEDIA_BUYS[media_buy_id] = {
-        "media_buy_id": media_buy_id,
-        "buyer_ref": buyer_ref,
-        "packages": created_packages,
-        "start_time": start_time or "asap",
-        "end_time": end_time or "2025-03-15T23:59:59Z",
-        "status": "active"
-    }
+    with _MEDIA_BUYS_LOCK:
+        _MEDIA_BUYS[media_buy_id] = {
+            "media_buy_id": media_buy_id,
+            "buyer_ref": buyer_ref,
+            "packages": created_packages,
+            "start_time": start_time or "asap",
+            "end_time": end_time or "2025-03-15T23:59:59Z",
+            "status": "active"
+        }
+        _MEDIA_BUYS.move_to_end(media_buy_id)
+        _MEDIA_BUY_IDS_BY_BUYER_REF.setdefault(buyer_ref, []).append(media_buy_id)
+        if len(_MEDIA_BUYS) > _MEDIA_BUYS_MAX:
+            evicted_id, evicted = _MEDIA_BUYS.popitem(last=False)
+            evicted_ids = _MEDIA_BUY_IDS_BY_BUYER_REF.get(evicted["buyer_ref"], [])
+            if evicted_id in evicted_ids:
+                evicted_ids.remove(evicted_id)
+            if not evicted_ids:
+                _MEDIA_BUY_IDS_BY_BUYER_REF.pop(evicted["buyer_ref"], None)
     
     # Return official schema success response
     return {
@@ -530,6 +773,10 @@ def handle_create_media_buy(args: Dict) -> Dict:
     }
 
 
+# Package reported for media buys that are unknown to this container
+_DEFAULT_DELIVERY_PACKAGES = ({"package_id": "pkg_001", "budget": 50000},)
+
+
 def handle_get_media_buy_delivery(args: Dict) -> Dict:
     """AdCP Media Buy Protocol - get_media_buy_delivery (Official Schema)
     
@@ -551,8 +798,19 @@ def handle_get_media_buy_delivery(args: Dict) -> Dict:
     total_impressions = 0
     total_spend = 0
     
-    for mb_id in media_buy_ids or ["mb_default_001"]:
-        media_buy = _MEDIA_BUYS.get(mb_id, {})
+    # Resolve every requested media buy under a single lock acquisition.
+    # buyer_refs select media buys only when no explicit ids are given.
+    with _MEDIA_BUYS_LOCK:
+        if not media_buy_ids and buyer_refs:
+            media_buy_ids = [
+                mb_id
+                for ref in buyer_refs if isinstance(ref, str)
+                for mb_id in _MEDIA_BUY_IDS_BY_BUYER_REF.get(ref, ())
+            ]
+        media_buy_ids = media_buy_ids or ["mb_default_001"]
+        media_buys = [_MEDIA_BUYS.get(mb_id, {}) for mb_id in media_buy_ids]
+    
+    for mb_id, media_buy in zip(media_buy_ids, media_buys):
         packages = media_buy.get("packages", [])
         
         # Generate realistic delivery metrics
@@ -560,7 +818,7 @@ def handle_get_media_buy_delivery(args: Dict) -> Dict:
         mb_impressions = 0
         mb_spend = 0
         
-        for pkg in packages or [{"package_id": "pkg_001", "budget": 50000}]:
+        for pkg in packages or _DEFAULT_DELIVERY_PACKAGES:
             budget = pkg.get("budget", 50000)
             spend = budget * 0.5  # 50% spent
             impressions = int(budget / 42.5 * 1000 * 0.5)  # Based on avg CPM, 50% delivered
@@ -613,6 +871,22 @@ def handle_get_media_buy_delivery(args: Dict) -> Dict:
     }
 
 
+# URL keyword -> (brand safety score, tier) for properties without a catalog
+# product. Listed in priority order: the first keyword wins when several match.
+_URL_KEYWORD_RATINGS = {
+    "espn": (96, "tier_1"),
+    "fox": (96, "tier_1"),
+    "nbc": (96, "tier_1"),
+    "youtube": (89, "tier_1"),
+    "google": (89, "tier_1"),
+    "twitch": (85, "tier_2"),
+}
+_URL_KEYWORD_RANK = {keyword: rank for rank, keyword in enumerate(_URL_KEYWORD_RATINGS)}
+# Lookahead so overlapping keywords (e.g. "youtubespn") are all reported
+_URL_KEYWORD_PATTERN = re.compile("(?=(%s))" % "|".join(map(re.escape, _URL_KEYWORD_RATINGS)))
+_UGC_KEYWORDS = frozenset({"youtube", "twitch"})
+
+
 def handle_verify_brand_safety(args: Dict) -> Dict:
     """MCP Verification Service - verify_brand_safety
     
@@ -621,39 +895,28 @@ def handle_verify_brand_safety(args: Dict) -> Dict:
     properties = args.get("properties", [])
     tier_required = args.get("brand_safety_tier", "tier_1")
     
-    products = get_products()
-    product_urls = {p.get("property_url", "").lower(): p for p in products}
-    
     results = []
+    counts = {"approved": 0, "approved_with_conditions": 0, "blocked": 0}
     for prop in properties:
         url = prop.get("url", "") if isinstance(prop, dict) else str(prop)
         url_lower = url.lower()
         
         # Check if URL matches a known product
-        matched_product = None
-        for product_url, product in product_urls.items():
-            if product_url and product_url in url_lower:
-                matched_product = product
-                break
+        matched_product = _match_product_url(url_lower)
+        
+        # Every known keyword in the URL, found in a single scan
+        keywords = set(_URL_KEYWORD_PATTERN.findall(url_lower))
         
         if matched_product:
-            tier = matched_product.get("brand_safety_tier", "tier_2")
-            score = 96 if tier == "tier_1" else 85 if tier == "tier_2" else 70
-        elif "espn" in url_lower or "fox" in url_lower or "nbc" in url_lower:
-            score = 96
-            tier = "tier_1"
-        elif "youtube" in url_lower or "google" in url_lower:
-            score = 89
-            tier = "tier_1"
-        elif "twitch" in url_lower:
-            score = 85
-            tier = "tier_2"
+            score, tier = matched_product["_brand_safety_rating"]
+        elif keywords:
+            score, tier = _URL_KEYWORD_RATINGS[min(keywords, key=_URL_KEYWORD_RANK.__getitem__)]
         else:
             score = 75
             tier = "tier_2"
         
         risk_flags = []
-        if "youtube" in url_lower or "twitch" in url_lower:
+        if not keywords.isdisjoint(_UGC_KEYWORDS):
             risk_flags.append({
                 "flag": "ugc_content_variability",
                 "severity": "low",
@@ -661,6 +924,7 @@ def handle_verify_brand_safety(args: Dict) -> Dict:
             })
         
         recommendation = "approved" if score >= 90 else "approved_with_conditions" if score >= 75 else "blocked"
+        counts[recommendation] += 1
         
         results.append({
             "url": url,
@@ -672,19 +936,22 @@ def handle_verify_brand_safety(args: Dict) -> Dict:
         })
     
     return {
-        "verification_id": f"ver_{hash(str(properties)) % 10000:04d}",
+        "verification_id": f"ver_{next(_VER_COUNTER):04d}",
         "timestamp": "2025-01-15T14:30:00Z",
         "properties": results,
         "summary": {
             "total_properties": len(results),
-            "approved": sum(1 for r in results if r["recommendation"] == "approved"),
-            "approved_with_conditions": sum(1 for r in results if r["recommendation"] == "approved_with_conditions"),
-            "blocked": sum(1 for r in results if r["recommendation"] == "blocked")
+            **counts
         },
         "source": "mcp_gateway"
     }
 
 
+# Channel -> (share of households reached, identity match rate); anything else is treated as desktop
+_CHANNEL_REACH = {"ctv": (0.33, 0.78), "mobile": (0.57, 0.85)}
+_DEFAULT_CHANNEL_REACH = (0.24, 0.72)
+
+
 def handle_resolve_audience_reach(args: Dict) -> Dict:
     """MCP Identity Service - resolve_audience_reach
     
@@ -695,15 +962,9 @@ def handle_resolve_audience_reach(args: Dict) -> Dict:
     identity_types = args.get("identity_types", ["uid2", "rampid"])
     
     # Calculate reach based on signals data
-    signals = get_signals()
-    total_individuals = 0
-    total_households = 0
-    
-    for seg_id in audience_segments:
-        signal = next((s for s in signals if s.get("signal_id") == seg_id), None)
-        if signal:
-            total_individuals += signal.get("size_individuals", 0) or 0
-            total_households += signal.get("size_households", 0) or 0
+    sizes = [s["_sizes"] for s in map(get_signal, audience_segments) if s]
+    total_individuals = sum(individuals for individuals, _ in sizes)
+    total_households = sum(households for _, households in sizes)
     
     # If no specific segments, use average
     if total_individuals == 0:
@@ -712,19 +973,12 @@ def handle_resolve_audience_reach(args: Dict) -> Dict:
     
     channel_reach = []
     for ch in channels:
-        if ch == "ctv":
-            reach = int(total_households * 0.33)
-            match_rate = 0.78
-        elif ch == "mobile":
-            reach = int(total_households * 0.57)
-            match_rate = 0.85
-        else:  # desktop
-            reach = int(total_households * 0.24)
-            match_rate = 0.72
-        
+        # Anything but a known channel name (including non-strings) gets the desktop rates
+        reach_share, match_rate = (_CHANNEL_REACH.get(ch, _DEFAULT_CHANNEL_REACH)
+                                   if isinstance(ch, str) else _DEFAULT_CHANNEL_REACH)
         channel_reach.append({
             "channel": ch,
-            "reach_households": reach,
+            "reach_households": int(total_households * reach_share),
             "match_rate": match_rate
         })
     
@@ -770,7 +1024,7 @@ def handle_configure_study(args: Dict) -> Dict:
     
     return {
         "status": "configured",
-        "study_id": f"study_{provider[:3]}_{study_type[:4]}_{hash(study_name) % 1000:03d}",
+        "study_id": f"study_{provider[:3]}_{study_type[:4]}_{next(_STUDY_COUNTER):03d}",
         "study_name": study_name,
         "configuration": {
             "study_type": study_type,
@@ -795,3 +1049,20 @@ def handle_configure_study(args: Dict) -> Dict:
         "source": "mcp_gateway",
         "message": f"{study_type} study configured successfully. First interim report available Feb 15."
     }
+
+
+# ============================================================================
+# Tool Dispatch
+# ============================================================================
+
+# Built once at import so each invocation is a single dict lookup
+_HANDLERS = {
+    "get_products": handle_get_products,
+    "get_signals": handle_get_signals,
+    "activate_signal": handle_activate_signal,
+    "create_media_buy": handle_create_media_buy,
+    "get_media_buy_delivery": handle_get_media_buy_delivery,
+    "verify_brand_safety": handle_verify_brand_safety,
+    "resolve_audience_reach": handle_resolve_audience_reach,
+    "configure_brand_lift_study": handle_configure_study,
+}
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the AdCP MCP Lambda handler
+
+Checks the domain-indexed property URL lookup used by verify_brand_safety, and
+that handlers and response serialization cope with unusual request values.
+
+Usage:
+    python test_adcp_mcp_handler.py
+"""
+
+import json
+import os
+import sys
+
+# Add this directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import adcp_mcp_handler as handler
+
+
+PRODUCTS = [
+    {"product_id": "p1", "property_url": "espn.com"},
+    {"product_id": "p2", "property_url": "www.espn.com/nfl"},
+    {"product_id": "p3", "property_url": "fox.com"},
+    {"product_id": "p4", "property_url": "sports.fox.com"},
+    {"product_id": "p5", "property_url": "nbc.com/olympics"},
+]
+
+
+def use_products(products):
+    """Point the handler's URL indexes at the given products"""
+    handler._PRODUCTS_BY_URL = {(p.get("property_url") or "").lower(): p for p in products}
+    handler._PRODUCT_URLS_BY_DOMAIN = handler._index_product_urls(handler._PRODUCTS_BY_URL)
+
+
+def test_match_product_url_multiple_matches():
+    """URLs that match more than one product prefer the URL's own domain, then product order"""
+    saved = handler._PRODUCTS_BY_URL, handler._PRODUCT_URLS_BY_DOMAIN
+    try:
+        use_products(PRODUCTS)
+        # espn.com precedes www.espn.com/nfl, and both are in the URL
+        assert handler._match_product_url("https://www.espn.com/nfl/scores")["product_id"] == "p1"
+        # espn.com in the query comes first in product order, but the URL is on fox.com
+        assert handler._match_product_url("https://fox.com/shows?ref=espn.com")["product_id"] == "p3"
+        assert handler._match_product_url("https://nbc.com/olympics?via=fox.com")["product_id"] == "p5"
+        # fox.com is a substring of sports.fox.com and comes first
+        assert handler._match_product_url("https://sports.fox.com/mlb")["product_id"] == "p3"
+        # No product on cbs.com, so the scan finds fox.com in the query
+        assert handler._match_product_url("https://www.cbs.com/sports?partner=sports.fox.com")["product_id"] == "p3"
+        # nbc.com has a product, but its property_url is not in the URL
+        assert handler._match_product_url("https://nbc.com/news") is None
+        assert handler._match_product_url("https://example.org") is None
+    finally:
+        handler._PRODUCTS_BY_URL, handler._PRODUCT_URLS_BY_DOMAIN = saved
+
+
+def test_dumps_handles_integers_beyond_64_bits():
+    """Values orjson cannot encode fall back to the stdlib json module"""
+    body = handler._dumps({"budget": 10 ** 30})
+    assert json.loads(body) == {"budget": 10 ** 30}, body
+
+
+def test_resolve_audience_reach_ignores_unhashable_values():
+    """Object or list segments and channels are treated as unknown, not rejected"""
+    result = handler.handle_resolve_audience_reach({
+        "audience_segments": [{"id": "seg"}, ["seg"]],
+        "channels": ["ctv", {"name": "mobile"}, ["desktop"]],
+    })
+    assert [c["match_rate"] for c in result["channels"]] == [0.78, 0.72, 0.72], result
+
+
+def test_activate_signal_reports_unknown_signal_first():
+    """An unknown or unhashable signal id is SIGNAL_NOT_FOUND, even with bad deployments"""
+    for signal_id in ("no_such_signal", {"id": "x"}, ["x"]):
+        result = handler.handle_activate_signal({
+            "signal_agent_segment_id": signal_id,
+            "deployments": ["not-an-object"],
+        })
+        assert result["errors"][0]["code"] == "SIGNAL_NOT_FOUND", result
+
+
+if __name__ == "__main__":
+    test_match_product_url_multiple_matches()
+    test_dumps_handles_integers_beyond_64_bits()
+    test_resolve_audience_reach_ignores_unhashable_values()
+    test_activate_signal_reports_unknown_signal_first()
+    print("✅ All tests passed")
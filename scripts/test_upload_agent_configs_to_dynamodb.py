@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for upload_agent_configs_to_dynamodb.py
+
+Runs the uploader against the repository's agent configuration in --dry-run
+mode and checks that it never builds a DynamoDB table or client or writes
+anything.
+
+Usage:
+    python scripts/test_upload_agent_configs_to_dynamodb.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add this directory to path for imports
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import upload_agent_configs_to_dynamodb as uploader
+
+AGENT_CONFIG_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "agentcore", "deployment", "agent")
+
+
+def test_dry_run_never_builds_table_or_writes():
+    """--dry-run reports every item without loading boto3 or creating a table or client"""
+    def fail_get_dynamodb_table(*args, **kwargs):
+        raise AssertionError("--dry-run must not build a DynamoDB table")
+
+    def fail_get_dynamodb_client(*args, **kwargs):
+        raise AssertionError("--dry-run must not build a DynamoDB client")
+
+    saved_argv = sys.argv
+    saved_get_table = uploader.get_dynamodb_table
+    saved_get_client = uploader.get_dynamodb_client
+    saved_boto3 = sys.modules.pop("boto3", None)
+    # A None entry makes any "import boto3" raise ImportError
+    sys.modules["boto3"] = None
+    uploader.get_dynamodb_table = fail_get_dynamodb_table
+    uploader.get_dynamodb_client = fail_get_dynamodb_client
+    sys.argv = [
+        "upload_agent_configs_to_dynamodb.py",
+        "--table-name", "AgentConfigTable",
+        "--agent-config-dir", AGENT_CONFIG_DIR,
+        "--mode", "overwrite",
+        "--dry-run",
+    ]
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            uploader.main()
+    finally:
+        sys.argv = saved_argv
+        uploader.get_dynamodb_table = saved_get_table
+        uploader.get_dynamodb_client = saved_get_client
+        del sys.modules["boto3"]
+        if saved_boto3 is not None:
+            sys.modules["boto3"] = saved_boto3
+
+    output = buf.getvalue()
+    assert "🔍 Would write GLOBAL_CONFIG/v1" in output, output
+    assert "🔍 Would write" in output.replace("🔍 Would write GLOBAL_CONFIG/v1", ""), output
+    assert "Skipping existing-config comparison (dry run)" in output, output
+    assert "No existing configuration found" not in output, output
+    assert "❌ Failed: 0" in output, output
+    assert "🔍 DRY RUN complete - no changes were made" in output, output
+
+
+if __name__ == "__main__":
+    test_dry_run_never_builds_table_or_writes()
+    print("✅ All tests passed")
@@ -36,26 +36,100 @@ The script expects the following directory structure:
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import os
+import random
 import sys
-from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple, Optional, Union
 
-import boto3
-from botocore.exceptions import ClientError
+# boto3/botocore are imported where they are used: loading them costs a
+# noticeable fraction of a second, which --help and --dry-run never need.
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# BatchWriteItem accepts at most 25 items per request
+BATCH_SIZE = 25
+# Concurrent BatchWriteItem requests per uploader
+MAX_UPLOAD_WORKERS = 16
+# Attempts at a batch request (throttled or with unprocessed keys/items) before giving up
+MAX_BATCH_ATTEMPTS = 6
+# Errors that mean "slow down" rather than "this request is wrong"
+RETRYABLE_ERROR_CODES = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+})
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_SIZE = 100
+
+# Files up to this size are read with one os.read instead of a file object
+FAST_READ_MAX_SIZE = 64 * 1024
+
+# File name suffixes picked up by each uploader
+INSTRUCTION_SUFFIX = ".txt"
+CARD_SUFFIX = ".agent.card.json"
+JSON_SUFFIX = ".json"
+INSTRUCTION_SUFFIX_LEN = len(INSTRUCTION_SUFFIX)
+CARD_SUFFIX_LEN = len(CARD_SUFFIX)
+JSON_SUFFIX_LEN = len(JSON_SUFFIX)
+
+# An item to write paired with the message printed once it is written
+PendingItem = Tuple[Dict[str, Any], str]
+
+
+def _client_config():
+    """botocore Config shared by the table resource and the low-level client."""
+    from botocore.config import Config
+
+    # Pool headroom over MAX_UPLOAD_WORKERS so concurrent batches never wait on a
+    # connection, keep-alive so pooled connections survive between batches, and
+    # adaptive retries to back off when writes are throttled.
+    return Config(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 5},
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def get_dynamodb_table(table_name: str, region: str, profile: str = None):
-    """Get DynamoDB table resource."""
+    """Get DynamoDB table resource, reusing it (and its connection pool) across calls."""
+    import boto3
+
+    config = _client_config()
     if profile:
         session = boto3.Session(profile_name=profile)
-        dynamodb = session.resource("dynamodb", region_name=region)
+        dynamodb = session.resource("dynamodb", region_name=region, config=config)
     else:
-        dynamodb = boto3.resource("dynamodb", region_name=region)
+        dynamodb = boto3.resource("dynamodb", region_name=region, config=config)
     return dynamodb.Table(table_name)
 
 
+@functools.lru_cache(maxsize=None)
+def get_dynamodb_client(region: str, profile: str = None):
+    """
+    Get a low-level DynamoDB client for batch writes, reused across calls.
+    
+    A table resource's meta.client has the resource's type (de)serialization
+    hooked in and would reject pre-serialized items, so a plain client is built.
+    """
+    import boto3
+
+    config = _client_config()
+    if profile:
+        session = boto3.Session(profile_name=profile)
+        return session.client("dynamodb", region_name=region, config=config)
+    return boto3.client("dynamodb", region_name=region, config=config)
+
+
 def resolve_knowledge_base_ids(config: Dict[str, Any], stack_prefix: str, 
                                 unique_id: str, region: str, 
                                 profile: str = None) -> Dict[str, Any]:
@@ -88,6 +162,9 @@ def resolve_knowledge_base_ids(config: Dict[str, Any], stack_prefix: str,
     
     print(f"🔍 Resolving knowledge base IDs using pattern: {stack_prefix}-<name>-{unique_id}")
     
+    import boto3
+    from botocore.exceptions import BotoCoreError, ClientError
+    
     # Build a Bedrock client to list knowledge bases
     try:
         if profile:
@@ -95,7 +172,7 @@ def resolve_knowledge_base_ids(config: Dict[str, Any], stack_prefix: str,
             bedrock_client = session.client("bedrock-agent", region_name=region)
         else:
             bedrock_client = boto3.client("bedrock-agent", region_name=region)
-    except Exception as e:
+    except BotoCoreError as e:
         print(f"⚠️  Could not create Bedrock client: {e}", file=sys.stderr)
         print("   KB IDs will not be resolved. Values will be uploaded as-is.", file=sys.stderr)
         return config
@@ -116,7 +193,7 @@ def resolve_knowledge_base_ids(config: Dict[str, Any], stack_prefix: str,
             next_token = response.get("nextToken")
             if not next_token:
                 break
-    except Exception as e:
+    except (BotoCoreError, ClientError) as e:
         print(f"⚠️  Could not list knowledge bases: {e}", file=sys.stderr)
         print("   Will try .kb-ids file fallback.", file=sys.stderr)
     
@@ -130,7 +207,7 @@ def resolve_knowledge_base_ids(config: Dict[str, Any], stack_prefix: str,
             with open(kb_ids_file, 'r') as f:
                 kb_base_name_to_id = json.load(f)
             print(f"   📂 Loaded {len(kb_base_name_to_id)} KB ID(s) from {os.path.basename(kb_ids_file)}")
-        except Exception as e:
+        except (OSError, ValueError) as e:
             print(f"   ⚠️  Could not read KB IDs file: {e}")
     
     if not kb_name_to_id and not kb_base_name_to_id:
@@ -203,29 +280,271 @@ def resolve_knowledge_base_ids(config: Dict[str, Any], stack_prefix: str,
     return config
 
 
+def json_loads(data):
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def compact_json(content: Union[str, bytes]) -> str:
+    """
+    Re-serialize JSON file content without indentation or whitespace.
+    
+    Every reader of the config table parses JSON content, so dropping the
+    formatting shrinks request and item size without changing meaning.
+    Raw file bytes are parsed directly (orjson prefers bytes), saving a
+    decode of content that is about to be re-serialized anyway. Content that
+    does not parse is returned unchanged, decoded from UTF-8 if needed.
+    """
+    try:
+        data = json_loads(content)
+    except ValueError:
+        return content if isinstance(content, str) else content.decode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def read_file_bytes(filepath: str, size: Optional[int] = None) -> bytes:
+    """
+    Read a config file's raw content.
+    
+    When the caller knows the file size (e.g. from DirEntry.stat()) and it is
+    at most FAST_READ_MAX_SIZE, the file is read with a single os.read on a
+    raw descriptor, skipping file object construction.
+    """
+    if size is not None and size <= FAST_READ_MAX_SIZE:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            # One extra byte so a file that grew since the stat is noticed
+            data = os.read(fd, size + 1)
+        finally:
+            os.close(fd)
+        if len(data) == size:
+            return data
+    # Binary mode skips the text layer's incremental decoder and newline
+    # translation; the content is uploaded verbatim.
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
+def read_file(filepath: str, size: Optional[int] = None) -> str:
+    """Read a config file's content for upload, decoding it from UTF-8 exactly once."""
+    return read_file_bytes(filepath, size).decode("utf-8")
+
+
+def content_hash(content: str) -> str:
+    """Hash item content; stored so later runs can skip unchanged items."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def build_item(pk: str, sk: str, config_type: str, content: str,
+               agent_name: str = None, template_id: str = None,
+               updated_at: str = None) -> Dict[str, Any]:
+    """Build a config table item, stamped with updated_at (default: now)."""
+    item = {
+        "pk": pk,
+        "sk": sk,
+        "config_type": config_type,
+        "content": content,
+        "content_hash": content_hash(content),
+        "updated_at": updated_at or datetime.now(timezone.utc).isoformat()
+    }
+    if agent_name:
+        item["agent_name"] = agent_name
+    if template_id:
+        item["template_id"] = template_id
+    return item
+
+
 def put_item(table, pk: str, sk: str, config_type: str, content: str, 
-             agent_name: str = None, template_id: str = None) -> bool:
-    """Put a single item to DynamoDB."""
+             agent_name: str = None, template_id: str = None,
+             updated_at: str = None) -> bool:
+    """Put a single item to DynamoDB (or just report it when table is None)."""
+    if table is None:
+        print(f"🔍 Would write {pk}/{sk}")
+        return True
+    
+    from botocore.exceptions import ClientError
     try:
-        item = {
-            "pk": pk,
-            "sk": sk,
-            "config_type": config_type,
-            "content": content,
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        if agent_name:
-            item["agent_name"] = agent_name
-        if template_id:
-            item["template_id"] = template_id
-        
-        table.put_item(Item=item)
+        table.put_item(Item=build_item(pk, sk, config_type, content, agent_name, template_id, updated_at))
         return True
     except ClientError as e:
         print(f"❌ Error putting item {pk}/{sk}: {e}", file=sys.stderr)
         return False
 
 
+def _backoff(attempt: int) -> None:
+    """Sleep before retry number `attempt` (1-based) with jittered exponential backoff."""
+    time.sleep(min(0.1 * 2 ** attempt + random.random() * 0.1, 10))
+
+
+def _get_batch_hashes(table, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """
+    Fetch content_hash for up to BATCH_GET_SIZE keys.
+    
+    UnprocessedKeys are resent with backoff up to MAX_BATCH_ATTEMPTS times;
+    keys still unprocessed after that are left out, so their items are
+    treated as changed and written.
+    """
+    client = table.meta.client
+    hashes = {}
+    request = {
+        table.name: {
+            "Keys": [{"pk": pk, "sk": sk} for pk, sk in keys],
+            "ProjectionExpression": "pk, sk, content_hash",
+        }
+    }
+    for attempt in range(MAX_BATCH_ATTEMPTS):
+        if attempt:
+            _backoff(attempt)
+        response = client.batch_get_item(RequestItems=request)
+        for stored in response["Responses"].get(table.name, []):
+            if "content_hash" in stored:
+                hashes[(stored["pk"], stored["sk"])] = stored["content_hash"]
+        request = response.get("UnprocessedKeys")
+        if not request:
+            break
+    return hashes
+
+
+def get_stored_hashes(table, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """
+    Fetch the stored content_hash for each (pk, sk) with BatchGetItem.
+    
+    Requests for each group of BATCH_GET_SIZE keys are issued concurrently,
+    so the precheck costs about one round trip rather than one per group.
+    
+    Returns:
+        Mapping of (pk, sk) to content_hash for items that exist and have one
+    """
+    chunks = [keys[i:i + BATCH_GET_SIZE] for i in range(0, len(keys), BATCH_GET_SIZE)]
+    hashes = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(chunks))) as executor:
+        for chunk_hashes in executor.map(_get_batch_hashes, [table] * len(chunks), chunks):
+            hashes.update(chunk_hashes)
+    return hashes
+
+
+@functools.lru_cache(maxsize=None)
+def _type_serializer():
+    """TypeSerializer for the rare non-string attribute (boto3 loaded on first use)."""
+    from boto3.dynamodb.types import TypeSerializer
+    return TypeSerializer()
+
+
+def _serialize_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Convert an item to the AttributeValue form batch_write_item takes."""
+    return {
+        name: {"S": value} if type(value) is str else _type_serializer().serialize(value)
+        for name, value in item.items()
+    }
+
+
+def _write_batch(client, table_name: str, items: List[Tuple[Dict[str, Any], str]]) -> int:
+    """
+    Write one batch of items with a single BatchWriteItem request.
+    
+    Items are serialized once. Throttled requests and UnprocessedItems are
+    retried with jittered exponential backoff, up to MAX_BATCH_ATTEMPTS. Any
+    other ClientError is raised.
+    
+    Returns:
+        Number of items still unprocessed after the last attempt
+    """
+    from botocore.exceptions import ClientError
+    request = {table_name: [{"PutRequest": {"Item": _serialize_item(item)}} for item, _ in items]}
+    for attempt in range(MAX_BATCH_ATTEMPTS):
+        if attempt:
+            _backoff(attempt)
+        try:
+            response = client.batch_write_item(RequestItems=request)
+        except ClientError as e:
+            if (e.response["Error"]["Code"] not in RETRYABLE_ERROR_CODES
+                    or attempt == MAX_BATCH_ATTEMPTS - 1):
+                raise
+            continue
+        request = response.get("UnprocessedItems")
+        if not request:
+            return 0
+    return len(request[table_name])
+
+
+def put_items(table, client, items: List[Tuple[Dict[str, Any], str]]) -> Tuple[int, int]:
+    """
+    Put items to DynamoDB with BatchWriteItem, up to 25 items per request.
+    
+    Items whose content_hash matches the one already stored are skipped and
+    counted as successful. Batches are written concurrently. A failure means
+    a batch as a whole could not be written; its items are counted as failed.
+    
+    Args:
+        table: DynamoDB table resource, or None for a dry run
+        client: Low-level DynamoDB client for the writes, or None for a dry run
+        items: List of (item, success_message) pairs
+        
+    Returns:
+        Tuple of (success_count, failed_count)
+    """
+    if not items:
+        return 0, 0
+    
+    if table is None:
+        for item, _ in items:
+            print(f"🔍 Would write {item['pk']}/{item['sk']}")
+        return len(items), 0
+    
+    from botocore.exceptions import ClientError
+    success, failed = 0, 0
+    
+    try:
+        stored_hashes = get_stored_hashes(table, [(item["pk"], item["sk"]) for item, _ in items])
+    except ClientError as e:
+        print(f"⚠️  Warning: Could not read stored content hashes, writing all items: {e}",
+              file=sys.stderr)
+        stored_hashes = {}
+    changed = []
+    for item, message in items:
+        if stored_hashes.get((item["pk"], item["sk"])) == item["content_hash"]:
+            print(f"⏭️  Unchanged {item['pk']}/{item['sk']}")
+            success += 1
+        else:
+            changed.append((item, message))
+    items = changed
+    if not items:
+        return success, failed
+    
+    batches = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(batches))) as executor:
+        futures = [executor.submit(_write_batch, client, table.name, batch) for batch in batches]
+        for batch, future in zip(batches, futures):
+            try:
+                unprocessed = future.result()
+            except ClientError as e:
+                print(f"❌ Error writing batch of {len(batch)} items: {e}", file=sys.stderr)
+                failed += len(batch)
+                continue
+            if unprocessed:
+                print(f"❌ {unprocessed} of {len(batch)} items still unprocessed after "
+                      f"{MAX_BATCH_ATTEMPTS} attempts", file=sys.stderr)
+                failed += len(batch)
+                continue
+            
+            for _, message in batch:
+                print(message)
+            success += len(batch)
+    
+    return success, failed
+
+
 def check_existing_config(table) -> Optional[Dict[str, Any]]:
     """
     Check if GLOBAL_CONFIG exists in DynamoDB.
@@ -233,17 +552,20 @@ def check_existing_config(table) -> Optional[Dict[str, Any]]:
     Returns:
         The existing global configuration if found, None otherwise.
     """
+    from botocore.exceptions import ClientError
     try:
+        # Only the content attribute is parsed, so don't transfer the rest of the item
         response = table.get_item(
             Key={
                 "pk": "GLOBAL_CONFIG",
                 "sk": "v1"
-            }
+            },
+            ProjectionExpression="content"
         )
         if "Item" in response:
             item = response["Item"]
             content = item.get("content", "{}")
-            return json.loads(content)
+            return json_loads(content)
         return None
     except ClientError as e:
         print(f"⚠️  Warning: Could not check existing config: {e}", file=sys.stderr)
@@ -305,47 +627,25 @@ def merge_configurations(existing_config: Dict[str, Any],
     Returns:
         Tuple of (merged_config, changes_summary)
     """
-    merged = {
-        "agent_configs": dict(existing_config.get("agent_configs", {})),
-        "configured_colors": dict(existing_config.get("configured_colors", {})),
-        "knowledge_bases": dict(existing_config.get("knowledge_bases", {}))
-    }
-    
-    changes = {
-        "agents_added": [],
-        "agents_skipped": [],
-        "colors_added": [],
-        "colors_skipped": [],
-        "knowledge_bases_added": [],
-        "knowledge_bases_skipped": []
-    }
-    
-    # Merge agent_configs - only add new agents
-    file_agents = file_config.get("agent_configs", {})
-    for agent_name, agent_config in file_agents.items():
-        if agent_name in merged["agent_configs"]:
-            changes["agents_skipped"].append(agent_name)
-        else:
-            merged["agent_configs"][agent_name] = agent_config
-            changes["agents_added"].append(agent_name)
-    
-    # Merge configured_colors - only add new colors
-    file_colors = file_config.get("configured_colors", {})
-    for agent_name, color in file_colors.items():
-        if agent_name in merged["configured_colors"]:
-            changes["colors_skipped"].append(agent_name)
-        else:
-            merged["configured_colors"][agent_name] = color
-            changes["colors_added"].append(agent_name)
-    
-    # Merge knowledge_bases - only add new mappings
-    file_kb = file_config.get("knowledge_bases", {})
-    for kb_name, kb_id in file_kb.items():
-        if kb_name in merged["knowledge_bases"]:
-            changes["knowledge_bases_skipped"].append(kb_name)
-        else:
-            merged["knowledge_bases"][kb_name] = kb_id
-            changes["knowledge_bases_added"].append(kb_name)
+    merged = {}
+    changes = {}
+    
+    # Merge agent_configs, configured_colors and knowledge_bases - only add new keys
+    for section, change_key in (("agent_configs", "agents"),
+                                ("configured_colors", "colors"),
+                                ("knowledge_bases", "knowledge_bases")):
+        existing = existing_config.get(section, {})
+        incoming = file_config.get(section, {})
+        
+        # Classify keys with set operations; iterate the file dict to keep its order
+        new_keys = incoming.keys() - existing.keys()
+        skipped_keys = incoming.keys() & existing.keys()
+        added = [key for key in incoming if key in new_keys]
+        
+        # Built in one step rather than copying existing and updating the copy
+        merged[section] = {**existing, **{key: incoming[key] for key in added}}
+        changes[f"{change_key}_added"] = added
+        changes[f"{change_key}_skipped"] = [key for key in incoming if key in skipped_keys]
     
     return merged, changes
 
@@ -466,7 +766,7 @@ def save_existing_config_to_local(existing_config: Dict[str, Any], config_dir: s
             json.dump(existing_config, f, indent=4, ensure_ascii=False)
         print(f"   ✅ Local file updated: {config_path}")
         return True
-    except Exception as e:
+    except OSError as e:
         print(f"   ❌ Failed to update local file: {e}", file=sys.stderr)
         return False
 
@@ -493,10 +793,8 @@ def offer_local_config_update(existing_config: Dict[str, Any],
     only_in_ddb = existing_agents - file_agents
     only_in_file = file_agents - existing_agents
 
-    # Check if configs differ at all (simple JSON comparison)
-    existing_json = json.dumps(existing_config, sort_keys=True)
-    file_json = json.dumps(file_config, sort_keys=True)
-    configs_differ = existing_json != file_json
+    # Check if configs differ at all (nested dict equality stops at the first difference)
+    configs_differ = existing_config != file_config
 
     if not configs_differ:
         print("   ℹ️  Local file already matches DynamoDB configuration.")
@@ -552,7 +850,8 @@ def offer_local_config_update(existing_config: Dict[str, Any],
 def upload_global_config(table, config_dir: str, mode: str = 'overwrite', 
                          existing_config: Optional[Dict[str, Any]] = None,
                          stack_prefix: str = None, unique_id: str = None,
-                         region: str = None, profile: str = None) -> Tuple[int, int]:
+                         region: str = None, profile: str = None,
+                         updated_at: str = None) -> Tuple[int, int]:
     """
     Upload global configuration with merge/overwrite support.
     
@@ -569,6 +868,7 @@ def upload_global_config(table, config_dir: str, mode: str = 'overwrite',
         unique_id: Deployment unique ID for KB ID resolution
         region: AWS region for KB ID resolution
         profile: AWS profile for KB ID resolution
+        updated_at: Timestamp for the uploaded item (default: now)
         
     Returns:
         Tuple of (success_count, failed_count)
@@ -576,13 +876,15 @@ def upload_global_config(table, config_dir: str, mode: str = 'overwrite',
     success, failed = 0, 0
     config_path = os.path.join(config_dir, "global_configuration.json")
     
-    if not os.path.exists(config_path):
-        print(f"⚠️  global_configuration.json not found at {config_path}")
-        return success, failed
-    
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            file_config = json.load(f)
+        # Parsed once here; the same dict is passed to the summary and
+        # offer_local_config_update rather than re-reading the file.
+        try:
+            with open(config_path, "rb") as f:
+                file_config = json_loads(f.read())
+        except FileNotFoundError:
+            print(f"⚠️  global_configuration.json not found at {config_path}")
+            return success, failed
         
         # Resolve knowledge base name references to real KB IDs before uploading.
         # This uses the Bedrock API to look up KBs named <stack-prefix>-<value>-<unique-id>.
@@ -599,7 +901,7 @@ def upload_global_config(table, config_dir: str, mode: str = 'overwrite',
             if not display_changes_summary('merge', changes, file_config, existing_config, config_dir):
                 return success, failed
             
-            content = json.dumps(merged_config)
+            config_to_upload = merged_config
             print()
             print("🔄 Applying merged configuration...")
         else:
@@ -608,11 +910,21 @@ def upload_global_config(table, config_dir: str, mode: str = 'overwrite',
                 if not display_changes_summary('overwrite', {}, file_config, existing_config, config_dir):
                     return success, failed
             
-            content = json.dumps(file_config)
+            config_to_upload = file_config
             print()
             print("🔄 Applying configuration (overwrite mode)...")
         
-        if put_item(table, "GLOBAL_CONFIG", "v1", "global_config", content):
+        # A merge that adds nothing (or an overwrite with identical content)
+        # would rewrite the same config; the loaders key their cache on
+        # updated_at, so leaving the item alone also keeps their caches warm.
+        if config_to_upload == existing_config:
+            print("⏭️  Unchanged GLOBAL_CONFIG/v1")
+            return success + 1, failed
+        
+        # Serialized only once the user has confirmed, so a cancelled run
+        # never pays for dumping the config
+        content = json_dumps(config_to_upload)
+        if put_item(table, "GLOBAL_CONFIG", "v1", "global_config", content, updated_at=updated_at):
             print(f"✅ Uploaded global_configuration.json")
             success += 1
         else:
@@ -621,172 +933,256 @@ def upload_global_config(table, config_dir: str, mode: str = 'overwrite',
     except json.JSONDecodeError as e:
         print(f"❌ Error parsing {config_path}: {e}", file=sys.stderr)
         failed += 1
-    except Exception as e:
+    except (OSError, UnicodeDecodeError) as e:
         print(f"❌ Error reading {config_path}: {e}", file=sys.stderr)
         failed += 1
     
     return success, failed
 
 
-def upload_agent_instructions(table, config_dir: str) -> Tuple[int, int]:
-    """Upload agent instructions from agent-instructions-library."""
-    success, failed = 0, 0
+def _entry_name(entry: os.DirEntry) -> str:
+    """Sort key giving every collector the same file order on any filesystem."""
+    return entry.name
+
+
+def collect_agent_instructions(config_dir: str, updated_at: str = None) -> Tuple[List[PendingItem], int]:
+    """
+    Collect agent instruction items from agent-instructions-library.
+    
+    Returns:
+        Tuple of ((item, success_message) pairs, count of files that could not be read)
+    """
+    failed = 0
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
     instructions_dir = os.path.join(config_dir, "agent-instructions-library")
     
-    if not os.path.exists(instructions_dir):
+    # scandir reports a missing directory itself; no separate exists() stat
+    try:
+        entries = os.scandir(instructions_dir)
+    except FileNotFoundError:
         print(f"⚠️  Instructions directory not found: {instructions_dir}")
-        return success, failed
-    
-    for filename in os.listdir(instructions_dir):
-        if filename.endswith(".txt") and not filename.startswith("_"):
-            agent_name = filename.replace(".txt", "")
-            filepath = os.path.join(instructions_dir, filename)
+        return [], failed
+    
+    # Attributes shared by every item; each file only adds its own
+    base = {"sk": "v1", "config_type": "instruction", "updated_at": updated_at}
+    items = []
+    with entries:
+        for entry in sorted(entries, key=_entry_name):
+            filename = entry.name
+            # Name checks first; is_file() uses the cached readdir type
+            if (filename[0] == "_" or filename[-INSTRUCTION_SUFFIX_LEN:] != INSTRUCTION_SUFFIX
+                    or not entry.is_file()):
+                continue
+            agent_name = filename[:-INSTRUCTION_SUFFIX_LEN]
+            filepath = entry.path
             
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = read_file(filepath, entry.stat().st_size)
                 
-                pk = f"INSTRUCTION#{agent_name}"
-                if put_item(table, pk, "v1", "instruction", content, agent_name=agent_name):
-                    print(f"✅ Uploaded instructions for {agent_name}")
-                    success += 1
-                else:
-                    failed += 1
-            except Exception as e:
+                items.append(({**base, "pk": f"INSTRUCTION#{agent_name}", "agent_name": agent_name,
+                                "content": content, "content_hash": content_hash(content)},
+                              f"✅ Uploaded instructions for {agent_name}"))
+            except (OSError, UnicodeDecodeError) as e:
                 print(f"❌ Error reading {filepath}: {e}", file=sys.stderr)
                 failed += 1
     
-    return success, failed
+    return items, failed
 
 
-def upload_agent_cards(table, config_dir: str) -> Tuple[int, int]:
-    """Upload agent cards from agent_cards directory."""
-    success, failed = 0, 0
+def collect_agent_cards(config_dir: str, updated_at: str = None) -> Tuple[List[PendingItem], int]:
+    """
+    Collect agent card items from the agent_cards directory.
+    
+    Returns:
+        Tuple of ((item, success_message) pairs, count of files that could not be read)
+    """
+    failed = 0
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
     cards_dir = os.path.join(config_dir, "agent_cards")
     
-    if not os.path.exists(cards_dir):
+    # scandir reports a missing directory itself; no separate exists() stat
+    try:
+        entries = os.scandir(cards_dir)
+    except FileNotFoundError:
         print(f"⚠️  Agent cards directory not found: {cards_dir}")
-        return success, failed
-    
-    for filename in os.listdir(cards_dir):
-        if filename.endswith(".agent.card.json"):
-            agent_name = filename.replace(".agent.card.json", "")
-            filepath = os.path.join(cards_dir, filename)
+        return [], failed
+    
+    base = {"sk": "v1", "config_type": "card", "updated_at": updated_at}
+    items = []
+    with entries:
+        for entry in sorted(entries, key=_entry_name):
+            filename = entry.name
+            if not filename.endswith(CARD_SUFFIX) or not entry.is_file():
+                continue
+            agent_name = filename[:-CARD_SUFFIX_LEN]
+            filepath = entry.path
             
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = compact_json(read_file_bytes(filepath, entry.stat().st_size))
                 
-                pk = f"CARD#{agent_name}"
-                if put_item(table, pk, "v1", "card", content, agent_name=agent_name):
-                    print(f"✅ Uploaded card for {agent_name}")
-                    success += 1
-                else:
-                    failed += 1
-            except Exception as e:
+                items.append(({**base, "pk": f"CARD#{agent_name}", "agent_name": agent_name,
+                                "content": content, "content_hash": content_hash(content)},
+                              f"✅ Uploaded card for {agent_name}"))
+            except (OSError, UnicodeDecodeError) as e:
                 print(f"❌ Error reading {filepath}: {e}", file=sys.stderr)
                 failed += 1
     
-    return success, failed
+    return items, failed
 
 
-def upload_visualization_maps(table, config_dir: str) -> Tuple[int, int]:
-    """Upload visualization maps from agent-visualization-maps directory."""
-    success, failed = 0, 0
+def collect_visualization_maps(config_dir: str, updated_at: str = None) -> Tuple[List[PendingItem], int]:
+    """
+    Collect visualization map items from the agent-visualization-maps directory.
+    
+    Returns:
+        Tuple of ((item, success_message) pairs, count of files that could not be read)
+    """
+    failed = 0
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
     maps_dir = os.path.join(config_dir, "agent-visualizations-library", "agent-visualization-maps")
     
-    if not os.path.exists(maps_dir):
+    # scandir reports a missing directory itself; no separate exists() stat
+    try:
+        entries = os.scandir(maps_dir)
+    except FileNotFoundError:
         print(f"⚠️  Visualization maps directory not found: {maps_dir}")
-        return success, failed
-    
-    for filename in os.listdir(maps_dir):
-        if filename.endswith(".json"):
-            agent_name = filename.replace(".json", "")
-            filepath = os.path.join(maps_dir, filename)
+        return [], failed
+    
+    base = {"sk": "v1", "config_type": "visualization_map", "updated_at": updated_at}
+    items = []
+    with entries:
+        for entry in sorted(entries, key=_entry_name):
+            filename = entry.name
+            if not filename.endswith(JSON_SUFFIX) or not entry.is_file():
+                continue
+            agent_name = filename[:-JSON_SUFFIX_LEN]
+            filepath = entry.path
             
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = compact_json(read_file_bytes(filepath, entry.stat().st_size))
                 
-                pk = f"VIZ_MAP#{agent_name}"
-                if put_item(table, pk, "v1", "visualization_map", content, agent_name=agent_name):
-                    print(f"✅ Uploaded viz map for {agent_name}")
-                    success += 1
-                else:
-                    failed += 1
-            except Exception as e:
+                items.append(({**base, "pk": f"VIZ_MAP#{agent_name}", "agent_name": agent_name,
+                                "content": content, "content_hash": content_hash(content)},
+                              f"✅ Uploaded viz map for {agent_name}"))
+            except (OSError, UnicodeDecodeError) as e:
                 print(f"❌ Error reading {filepath}: {e}", file=sys.stderr)
                 failed += 1
     
-    return success, failed
+    return items, failed
 
 
-def upload_visualization_templates(table, config_dir: str) -> Tuple[int, int]:
-    """Upload visualization templates from agent-visualizations-library directory."""
-    success, failed = 0, 0
-    viz_dir = os.path.join(config_dir, "agent-visualizations-library")
+def collect_visualization_templates(config_dir: str, updated_at: str = None) -> Tuple[List[PendingItem], int]:
+    """
+    Collect visualization template items from the agent-visualizations-library directory.
     
-    if not os.path.exists(viz_dir):
-        print(f"⚠️  Visualizations directory not found: {viz_dir}")
-        return success, failed
+    Returns:
+        Tuple of ((item, success_message) pairs, count of files that could not be read)
+    """
+    failed = 0
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
+    viz_dir = os.path.join(config_dir, "agent-visualizations-library")
     
-    for filename in os.listdir(viz_dir):
-        # Skip directories and non-JSON files
-        filepath = os.path.join(viz_dir, filename)
-        if os.path.isdir(filepath) or not filename.endswith(".json"):
-            continue
-        
-        # Parse agent name and template ID from filename
-        # Format: AgentName-template-id.json
-        parts = filename.replace(".json", "").split("-", 1)
-        if len(parts) != 2:
-            continue
-        
-        agent_name = parts[0]
-        template_id = parts[1]
-        
+    # Walk viz_dir and its generic templates subdirectory in one loop. The
+    # subdirectory is found in viz_dir's own listing, so it needs no separate
+    # existence check, and each file is classified by the directory it is in.
+    base = {"config_type": "visualization_template", "updated_at": updated_at}
+    items = []
+    pending = [(viz_dir, False)]
+    while pending:
+        scan_dir, is_generic = pending.pop()
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            pk = f"VIZ_TEMPLATE#{agent_name}"
-            if put_item(table, pk, template_id, "visualization_template", content, 
-                       agent_name=agent_name, template_id=template_id):
-                print(f"✅ Uploaded template {template_id} for {agent_name}")
-                success += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"❌ Error reading {filepath}: {e}", file=sys.stderr)
-            failed += 1
-    
-    # Also upload generic templates
-    generic_dir = os.path.join(viz_dir, "generic-visualization-templates")
-    if os.path.exists(generic_dir):
-        for filename in os.listdir(generic_dir):
-            if not filename.endswith(".json"):
+            entries = os.scandir(scan_dir)
+        except FileNotFoundError:
+            if is_generic:
+                # Removed after viz_dir was listed; keep what was already collected
                 continue
-            
-            template_id = filename.replace(".json", "")
-            filepath = os.path.join(generic_dir, filename)
-            
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
+            print(f"⚠️  Visualizations directory not found: {scan_dir}")
+            return [], failed
+        with entries:
+            for entry in sorted(entries, key=_entry_name):
+                filename = entry.name
+                # Filter on the name first; the generic templates subdirectory
+                # is the only non-JSON entry of interest. is_dir()/is_file()
+                # use the cached readdir type.
+                if not filename.endswith(JSON_SUFFIX):
+                    if (not is_generic and filename == "generic-visualization-templates"
+                            and entry.is_dir()):
+                        pending.append((entry.path, True))
+                    continue
+                if not entry.is_file():
+                    continue
+                name = filename[:-JSON_SUFFIX_LEN]
                 
-                # Store generic templates with a special agent name
-                pk = "VIZ_TEMPLATE#_GENERIC"
-                if put_item(table, pk, template_id, "visualization_template", content,
-                           agent_name="_GENERIC", template_id=template_id):
-                    print(f"✅ Uploaded generic template {template_id}")
-                    success += 1
+                if is_generic:
+                    # Store generic templates with a special agent name
+                    agent_name = "_GENERIC"
+                    template_id = name
+                    message = f"✅ Uploaded generic template {template_id}"
                 else:
+                    # Parse agent name and template ID from filename
+                    # Format: AgentName-template-id.json
+                    parts = name.split("-", 1)
+                    if len(parts) != 2:
+                        continue
+                    agent_name, template_id = parts
+                    message = f"✅ Uploaded template {template_id} for {agent_name}"
+                
+                filepath = entry.path
+                try:
+                    content = compact_json(read_file_bytes(filepath, entry.stat().st_size))
+                    
+                    items.append(({**base, "pk": f"VIZ_TEMPLATE#{agent_name}", "sk": template_id,
+                                    "agent_name": agent_name, "template_id": template_id,
+                                    "content": content, "content_hash": content_hash(content)},
+                                  message))
+                except (OSError, UnicodeDecodeError) as e:
+                    print(f"❌ Error reading {filepath}: {e}", file=sys.stderr)
                     failed += 1
-            except Exception as e:
-                print(f"❌ Error reading {filepath}: {e}", file=sys.stderr)
-                failed += 1
     
-    return success, failed
+    return items, failed
+
+
+# File-based config categories, in upload order: (header, collector).
+# upload_visualization_templates_to_dynamodb.py uploads a subset of these.
+FILE_COLLECTORS = (
+    ("📝 Reading agent instructions...", collect_agent_instructions),
+    ("🎴 Reading agent cards...", collect_agent_cards),
+    ("🗺️  Reading visualization maps...", collect_visualization_maps),
+    ("📊 Reading visualization templates...", collect_visualization_templates),
+)
+
+
+def upload_files(table, client, config_dir: str, collectors,
+                 updated_at: str = None) -> Tuple[int, int]:
+    """
+    Collect items for each file-based category, then write them all at once.
+    
+    A single put_items call lets batches from every category share the
+    writer pool instead of each category waiting for the previous one.
+    
+    Args:
+        table: DynamoDB table resource, or None for a dry run
+        client: Low-level DynamoDB client for the writes, or None for a dry run
+        config_dir: Path to agent configuration directory
+        collectors: (header, collect function) pairs, e.g. FILE_COLLECTORS
+        updated_at: Timestamp for every uploaded item (default: now)
+        
+    Returns:
+        Tuple of (success_count, failed_count)
+    """
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
+    items = []
+    failed = 0
+    for header, collect in collectors:
+        print(header)
+        collected, f = collect(config_dir, updated_at)
+        print(f"   {len(collected)} item(s)")
+        items.extend(collected)
+        failed += f
+    print()
+    
+    s, f = put_items(table, client, items)
+    return s, failed + f
 
 
 def main():
@@ -857,12 +1253,17 @@ def main():
     if args.dry_run:
         print("🔍 DRY RUN - No changes will be made")
         print()
-    
-    table = get_dynamodb_table(args.table_name, args.region, args.profile)
-    
-    # Check for existing configuration
-    print("🔍 Checking for existing configuration in DynamoDB...")
-    existing_config = check_existing_config(table)
+        # No table or client: writes are only reported and boto3 is never loaded
+        table = None
+        client = None
+        existing_config = None
+    else:
+        table = get_dynamodb_table(args.table_name, args.region, args.profile)
+        client = get_dynamodb_client(args.region, args.profile)
+        
+        # Check for existing configuration
+        print("🔍 Checking for existing configuration in DynamoDB...")
+        existing_config = check_existing_config(table)
     
     # Determine the mode to use
     mode = args.mode
@@ -871,6 +1272,9 @@ def main():
         if mode == 'prompt':
             mode = prompt_merge_or_overwrite()
         print(f"   Using mode: {mode}")
+    elif args.dry_run:
+        print("ℹ️  Skipping existing-config comparison (dry run). Showing a fresh upload.")
+        mode = 'overwrite'
     else:
         print("ℹ️  No existing configuration found. Will upload fresh configuration.")
         mode = 'overwrite'  # No existing config, so just upload
@@ -880,14 +1284,20 @@ def main():
     total_success = 0
     total_failed = 0
     
+    # Every item written by this run carries the same updated_at
+    upload_timestamp = datetime.now(timezone.utc).isoformat()
+    
     # Upload global config (with merge/overwrite handling and KB ID resolution)
     print("📄 Uploading global configuration...")
-    if args.stack_prefix and args.unique_id:
+    # KB ID resolution calls Bedrock, so a dry run leaves the names as-is
+    resolve_kb = args.stack_prefix and args.unique_id and not args.dry_run
+    if resolve_kb:
         print(f"   KB ID resolution enabled: {args.stack_prefix}-<name>-{args.unique_id}")
     s, f = upload_global_config(
         table, args.agent_config_dir, mode, existing_config,
-        stack_prefix=args.stack_prefix, unique_id=args.unique_id,
-        region=args.region, profile=args.profile
+        stack_prefix=args.stack_prefix if resolve_kb else None,
+        unique_id=args.unique_id if resolve_kb else None,
+        region=args.region, profile=args.profile, updated_at=upload_timestamp
     )
     total_success += s
     total_failed += f
@@ -904,30 +1314,8 @@ def main():
     
     print()
     
-    # Upload agent instructions
-    print("📝 Uploading agent instructions...")
-    s, f = upload_agent_instructions(table, args.agent_config_dir)
-    total_success += s
-    total_failed += f
-    print()
-    
-    # Upload agent cards
-    print("🎴 Uploading agent cards...")
-    s, f = upload_agent_cards(table, args.agent_config_dir)
-    total_success += s
-    total_failed += f
-    print()
-    
-    # Upload visualization maps
-    print("🗺️  Uploading visualization maps...")
-    s, f = upload_visualization_maps(table, args.agent_config_dir)
-    total_success += s
-    total_failed += f
-    print()
-    
-    # Upload visualization templates
-    print("📊 Uploading visualization templates...")
-    s, f = upload_visualization_templates(table, args.agent_config_dir)
+    print("📤 Uploading agent instructions, cards and visualizations...")
+    s, f = upload_files(table, client, args.agent_config_dir, FILE_COLLECTORS, upload_timestamp)
     total_success += s
     total_failed += f
     print()
@@ -942,7 +1330,10 @@ def main():
     if total_failed > 0:
         sys.exit(1)
     
-    print("✅ All configurations uploaded successfully!")
+    if args.dry_run:
+        print("🔍 DRY RUN complete - no changes were made")
+    else:
+        print("✅ All configurations uploaded successfully!")
 
 
 if __name__ == "__main__":